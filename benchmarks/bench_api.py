@@ -0,0 +1,148 @@
+"""Time every public Pluralizer entry point on realistic corpora, plus import and construction time.
+
+Each method is timed over every corpus with the result cache disabled, so the rules are measured rather than
+the cache, and reported in nanoseconds per word (the best of --repeat runs). Results can be saved as JSON and
+compared against a previous run, to catch regressions across versions.
+
+Usage:
+    python benchmarks/bench_api.py [--repeat 5] [--automaton] [--json results.json] [--compare baseline.json]
+        [--tolerance 0.2]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import string
+import sys
+import time
+from typing import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_import import first_use_time, import_time  # noqa: E402
+
+from pluralizer import Pluralizer  # noqa: E402
+from pluralizer.pluralizer_rules import irregular_rules, uncountable_rules  # noqa: E402
+
+STEMS = ["apple", "box", "city", "knife", "person", "bus", "analysis", "index", "hero", "tooth", "wolf", "baby"]
+NON_ASCII = ["café", "naïve", "straße", "résumé", "façade", "jalapeño", "piñata", "smörgåsbord", "crème", "öl"]
+
+
+def regular_words(size: int, generator: random.Random) -> list[str]:
+    """Distinct words sharing the endings of common nouns."""
+    words: set[str] = set()
+    while len(words) < size:
+        prefix = "".join(generator.choices(string.ascii_lowercase, k=generator.randint(2, 8)))
+        words.add(prefix + generator.choice(STEMS))
+    return sorted(words)
+
+
+def corpora(size: int, seed: int = 0) -> dict[str, list[str]]:
+    """Build the singular words of each corpus, `size` words each."""
+    generator = random.Random(seed)
+    regular = regular_words(size, generator)
+    irregular = [single for single, _ in irregular_rules]
+    uncountable = [rule for rule in uncountable_rules if isinstance(rule, str)]
+    long = ["".join(generator.choices(string.ascii_lowercase, k=generator.randint(25, 40))) + word for word in regular]
+    mixed_case = (
+        ["".join(char.upper() if generator.random() < 0.5 else char for char in word) for word in regular]
+        + [word.upper() for word in regular]
+        + [word.title() for word in regular]
+    )
+    non_ascii = [prefix + word for prefix in ("", "über", "ça") for word in NON_ASCII] + [
+        word + "é" for word in regular
+    ]
+
+    def resize(words: list[str]) -> list[str]:
+        return [words[position % len(words)] for position in range(size)]
+
+    return {
+        "irregular": resize(irregular),
+        "uncountable": resize(uncountable),
+        "regular": regular,
+        "long": resize(long),
+        "mixed_case": generator.sample(mixed_case, size),
+        "non_ascii": resize(non_ascii),
+    }
+
+
+def best_ns_per_call(function: Callable[[str], object], words: list[str], repeat: int) -> float:
+    timings: list[int] = []
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        for word in words:
+            _ = function(word)
+        timings.append(time.perf_counter_ns() - started)
+    return min(timings) / len(words)
+
+
+def run(size: int, repeat: int, automaton: bool = False) -> dict[str, float]:
+    """Return the nanoseconds per call of each benchmark, keyed by name."""
+    results: dict[str, float] = {}
+
+    results["import_ms"] = statistics.median(import_time("pluralizer") for _ in range(repeat)) * 1000
+    results["first_construction_ms"] = statistics.median(first_use_time() for _ in range(repeat)) * 1000
+    results["construction_ns"] = best_ns_per_call(lambda _: Pluralizer(), [""] * 100, repeat)
+
+    pluralizer = Pluralizer(cache_size=0)
+    if automaton:
+        _ = pluralizer.freeze(automaton=True)
+    for name, singulars in corpora(size).items():
+        plurals = pluralizer.plural_many(singulars)
+        methods: dict[str, tuple[Callable[[str], object], list[str]]] = {
+            "plural": (pluralizer.plural, singulars),
+            "singular": (pluralizer.singular, plurals),
+            "is_plural": (pluralizer.is_plural, plurals),
+            "is_singular": (pluralizer.is_singular, singulars),
+            "pluralize": (lambda word: pluralizer.pluralize(word, 2, True), singulars),
+        }
+        for method, (function, words) in methods.items():
+            results[f"{method}.{name}_ns"] = best_ns_per_call(function, words, repeat)
+
+    return results
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], tolerance: float) -> list[str]:
+    """List the benchmarks which are slower than the baseline by more than the tolerance."""
+    return [
+        f"{name}: {baseline[name]:.1f} -> {value:.1f}"
+        for name, value in results.items()
+        if name in baseline and value > baseline[name] * (1 + tolerance)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    _ = parser.add_argument("--words", type=int, default=2_000, help="words per corpus")
+    _ = parser.add_argument("--repeat", type=int, default=5)
+    _ = parser.add_argument("--automaton", action="store_true", help="search rules with suffix automata")
+    _ = parser.add_argument("--json", help="write the results to this file")
+    _ = parser.add_argument("--compare", help="compare with the results of a previous run")
+    _ = parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown, 0.2 is 20%%")
+    args = parser.parse_args()
+
+    results = run(args.words, args.repeat, args.automaton)
+    baseline: dict[str, float] = {}
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+
+    print(f"{'benchmark':<28} {'value':>10} {'baseline':>10}")
+    for name, value in results.items():
+        previous = f"{baseline[name]:>10.1f}" if name in baseline else ""
+        print(f"{name:<28} {value:>10.1f} {previous}")
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump({"python": platform.python_version(), "results": results}, file, indent=2)
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        sys.exit("Slower than the baseline:\n" + "\n".join(regressions))
+
+
+if __name__ == "__main__":
+    main()
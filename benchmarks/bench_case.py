@@ -0,0 +1,78 @@
+"""Count the case conversions (`str.lower`, `str.upper`, ...) made per inflected word, and time the inflection.
+
+Each of these calls allocates a new string. They are counted with a profile hook, so the counts are exact and do
+not depend on the machine. Words are lower case, upper case, title case and mixed case versions of a corpus.
+
+Usage:
+    python benchmarks/bench_case.py [--words 2000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+from collections import Counter
+from types import FrameType
+from typing import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_api import best_ns_per_call, corpora  # noqa: E402
+
+from pluralizer import Pluralizer  # noqa: E402
+
+CASE_CONVERSIONS = {"lower", "upper", "capitalize", "title", "swapcase", "casefold"}
+
+
+def shapes(words: list[str]) -> dict[str, list[str]]:
+    return {
+        "lower": words,
+        "upper": [word.upper() for word in words],
+        "title": [word.title() for word in words],
+        "mixed": [word[:-1] + word[-1].upper() for word in words],
+    }
+
+
+def count_conversions(function: Callable[[str], object], words: list[str]) -> Counter[str]:
+    """Count the case conversion calls made by the function over the words."""
+    calls: Counter[str] = Counter()
+
+    def profile(frame: FrameType, event: str, arg: object) -> None:
+        if event == "c_call":
+            name = getattr(arg, "__name__", "")
+            if name in CASE_CONVERSIONS:
+                calls[name] += 1
+
+    sys.setprofile(profile)
+    try:
+        for word in words:
+            _ = function(word)
+    finally:
+        sys.setprofile(None)
+    return calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    _ = parser.add_argument("--words", type=int, default=2_000)
+    _ = parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pluralizer = Pluralizer(cache_size=0)
+    corpus = corpora(args.words)
+    words = corpus["regular"] + corpus["irregular"] + corpus["uncountable"]
+    methods: dict[str, Callable[[str], object]] = {
+        "plural": pluralizer.plural,
+        "singular": pluralizer.singular,
+        "is_plural": pluralizer.is_plural,
+    }
+
+    print(f"{'method':>10} {'shape':>6} {'conversions/word':>16} {'ns/word':>8}")
+    for method, function in methods.items():
+        for shape, shaped in shapes(words).items():
+            conversions = sum(count_conversions(function, shaped).values()) / len(shaped)
+            elapsed = best_ns_per_call(function, shaped, args.repeat)
+            print(f"{method:>10} {shape:>6} {conversions:>16.2f} {elapsed:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
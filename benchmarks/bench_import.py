@@ -0,0 +1,67 @@
+"""Measure the cost of `import pluralizer` and of creating the first Pluralizer, in fresh interpreters.
+
+The import time is the cumulative time reported by `python -X importtime`. With --max-import-ms
+the script exits with an error when the median import time is above the threshold.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 10] [--max-import-ms 50]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIRST_USE = """
+import time
+import pluralizer
+started = time.perf_counter()
+pluralizer.Pluralizer().plural('box')
+print(time.perf_counter() - started)
+"""
+
+
+def import_time(module: str) -> float:
+    """Return the cumulative import time of a module in seconds, measured in a new interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    )
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1_000_000
+    raise RuntimeError(f"{module} was not imported:\n{result.stderr}")
+
+
+def first_use_time() -> float:
+    """Return the time to create the first Pluralizer and inflect a word, which loads the rules."""
+    result = subprocess.run([sys.executable, "-c", FIRST_USE], check=True, capture_output=True, text=True, cwd=ROOT)
+    return float(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    _ = parser.add_argument("--runs", type=int, default=10)
+    _ = parser.add_argument("--max-import-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    imports = [import_time("pluralizer") for _ in range(args.runs)]
+    first_uses = [first_use_time() for _ in range(args.runs)]
+
+    print(f"{'':>10} {'median ms':>9} {'min ms':>7}")
+    for label, timings in (("import", imports), ("first use", first_uses)):
+        print(f"{label:>10} {statistics.median(timings) * 1000:>9.1f} {min(timings) * 1000:>7.1f}")
+
+    if args.max_import_ms is not None and statistics.median(imports) * 1000 > args.max_import_ms:
+        sys.exit(f"import pluralizer took longer than {args.max_import_ms} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Compare the memory and lookup time of irregular words and uncountables stored in dicts and in compact tables.
+
+Usage:
+    python benchmarks/bench_memory.py [--pairs 50000] [--uncountables 50000]
+"""
+
+import argparse
+import gc
+import os
+import random
+import string
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pluralizer import Pluralizer  # noqa: E402
+
+
+def random_words(size: int, generator: random.Random) -> list[str]:
+    words: set[str] = set()
+    while len(words) < size:
+        words.add("".join(generator.choices(string.ascii_lowercase, k=generator.randint(5, 12))))
+    return sorted(words)
+
+
+def build(pairs: list[tuple[str, str]], uncountables: list[str], compact: bool) -> tuple[Pluralizer, int]:
+    """Return a frozen Pluralizer with only these words, and the memory it holds in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    pluralizer = Pluralizer(cache_size=0, default_rules=False)
+    for single, plural in pairs:
+        pluralizer.add_irregular_rule(single, plural)
+    for word in uncountables:
+        pluralizer.add_uncountable_rule(word)
+    _ = pluralizer.freeze(compact=compact)
+    gc.collect()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return pluralizer, allocated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    _ = parser.add_argument("--pairs", type=int, default=50_000)
+    _ = parser.add_argument("--uncountables", type=int, default=50_000)
+    args = parser.parse_args()
+
+    generator = random.Random(0)
+    words = random_words(2 * args.pairs + args.uncountables, generator)
+    pairs = list(zip(words[: args.pairs], words[args.pairs : 2 * args.pairs]))
+    uncountables = words[2 * args.pairs :]
+    entries = 2 * args.pairs + args.uncountables
+    lookups = [word for pair in pairs for word in pair][:20_000] + random_words(20_000, random.Random(1))
+
+    print(f"{'storage':>8} {'bytes':>12} {'bytes/entry':>11} {'ns/word':>8}")
+    for compact in (False, True):
+        # The rules store lower cased copies of the words, which are allocated while tracing.
+        pluralizer, allocated = build(pairs, uncountables, compact)
+        started = time.perf_counter()
+        for word in lookups:
+            _ = pluralizer.plural(word)
+        elapsed = (time.perf_counter() - started) / len(lookups)
+        label = "compact" if compact else "dict"
+        print(f"{label:>8} {allocated:>12} {allocated / entries:>11.1f} {elapsed * 1e9:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
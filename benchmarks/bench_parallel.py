@@ -0,0 +1,47 @@
+"""Measure how Pluralizer.plural_parallel scales with the number of worker processes.
+
+Usage:
+    python benchmarks/bench_parallel.py [--words 1000000] [--max-workers 8] [--chunksize 10000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_api import regular_words  # noqa: E402
+
+from pluralizer import Pluralizer  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    _ = parser.add_argument("--words", type=int, default=1_000_000)
+    _ = parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    _ = parser.add_argument("--chunksize", type=int, default=10_000)
+    args = parser.parse_args()
+
+    # Distinct words, so no two words hit the same cache entry.
+    words = regular_words(args.words, random.Random(0))
+    pluralizer = Pluralizer()
+    expected = pluralizer.plural_many(words)
+
+    baseline = 0.0
+    print(f"{'workers':>7} {'seconds':>8} {'words/s':>10} {'speedup':>7}")
+    workers = 1
+    while workers <= args.max_workers:
+        started = time.perf_counter()
+        results = pluralizer.plural_parallel(words, workers=workers, chunksize=args.chunksize)
+        elapsed = time.perf_counter() - started
+        assert results == expected
+
+        baseline = baseline or elapsed
+        print(f"{workers:>7} {elapsed:>8.2f} {len(words) / elapsed:>10.0f} {baseline / elapsed:>7.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Count the rules tried per word by a rule set grown with dead rules, and time the rule search.
+
+A service adds its custom rules again whenever its configuration is reloaded, so every reload adds a duplicate of
+each custom rule, and its uncountable regexes list words which are uncountables already. The rule search is timed
+and its regex searches counted without any analysis of the dead rules, with the suffix indexes leaving out the
+rules shadowed by a newer rule with the same pattern, as the Pluralizer does when rules are added, and after
+`prune_rules`, which only reports the uncountable regexes. Counts are exact and do not depend on the machine.
+
+Usage:
+    python benchmarks/bench_rules.py [--words 2000] [--custom 50] [--reloads 5] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import re
+import string
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_api import best_ns_per_call, corpora  # noqa: E402
+
+from pluralizer import Pluralizer  # noqa: E402
+from pluralizer.pluralizer_rules import uncountable_rules  # noqa: E402
+from pluralizer.rule_index import Rule, RuleIndex  # noqa: E402
+
+
+def custom_rules(size: int, generator: random.Random) -> list[tuple[str, str]]:
+    """Made up nouns ending like common ones, with their own plural."""
+    endings = ["us", "ex", "on", "um", "is", "a", "o", "y"]
+    nouns = {"".join(generator.choices(string.ascii_lowercase, k=5)) + generator.choice(endings) for _ in range(size)}
+    return [(noun, noun + "i") for noun in sorted(nouns)]
+
+
+def add_custom_rules(pluralizer: Pluralizer, rules: list[tuple[str, str]], uncountables: list[str]) -> None:
+    for single, plural in rules:
+        pluralizer.add_plural_rule(single, plural)
+        pluralizer.add_singular_rule(plural, single)
+    for start in range(0, len(uncountables), 4):
+        pluralizer.add_uncountable_rule(re.compile(r"(?i)^(" + "|".join(uncountables[start : start + 4]) + r")$"))
+
+
+def unanalysed(rules: list[Rule]) -> RuleIndex:
+    """A suffix index of every rule, including the shadowed ones."""
+    index = RuleIndex(rules)
+    index.shadowed = frozenset()
+    return index
+
+
+def regex_searches(index: RuleIndex, words: list[str]) -> float:
+    """Count the regexes searched per word, like `Pluralizer` does without an automaton."""
+    searches = 0
+    for word in words:
+        for position in index.candidates(word):
+            searches += 1
+            if index.rules[position][0].search(word):
+                break
+    return searches / len(words)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    _ = parser.add_argument("--words", type=int, default=2_000)
+    _ = parser.add_argument("--custom", type=int, default=50, help="custom rules of each kind")
+    _ = parser.add_argument("--reloads", type=int, default=5, help="times the custom rules are added")
+    _ = parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    generator = random.Random(0)
+    rules = custom_rules(args.custom, generator)
+    uncountables = [rule for rule in uncountable_rules if isinstance(rule, str)]
+    pluralizer = Pluralizer(cache_size=0)
+    for _ in range(args.reloads):
+        add_custom_rules(pluralizer, rules, uncountables)
+
+    # Uncountables never reach the rules, only regular words and the custom nouns are searched.
+    corpus = corpora(args.words)
+    singulars = corpus["regular"] + [single for single, _ in rules]
+    plurals = pluralizer.plural_many(singulars)
+    indexes = {
+        "unanalysed": (unanalysed(pluralizer.pluralRules), unanalysed(pluralizer.singularRules)),
+        "as added": (RuleIndex(pluralizer.pluralRules), RuleIndex(pluralizer.singularRules)),
+    }
+    dead = pluralizer.dead_rules()
+    _ = pluralizer.prune_rules()
+    indexes["pruned"] = (RuleIndex(pluralizer.pluralRules), RuleIndex(pluralizer.singularRules))
+
+    reasons = [rule.reason for rule in [*dead.plural_rules, *dead.singular_rules]]
+    print(", ".join(f"{reasons.count(reason)} {reason}" for reason in ["duplicate", "overridden", "uncountable"]))
+    print(f"{'rules':>10} {'kind':>8} {'count':>6} {'searches/word':>13} {'ns/word':>8}")
+    for name, (plural_index, singular_index) in indexes.items():
+        for kind, index, words in [("plural", plural_index, singulars), ("singular", singular_index, plurals)]:
+            count = len(index.rules) - len(index.shadowed)
+            searches = regex_searches(index, words)
+            elapsed = best_ns_per_call(index.search, words, args.repeat)
+            print(f"{name:>10} {kind:>8} {count:>6} {searches:>13.2f} {elapsed:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Compare Series.map(pluralizer.plural) with Pluralizer.plural_array on a large pandas column.
+
+Requires NumPy and pandas.
+
+Usage:
+    python benchmarks/bench_vectorized.py [--rows 10000000] [--distinct 100000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas  # noqa: E402
+from bench_api import regular_words  # noqa: E402
+
+from pluralizer import Pluralizer  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    _ = parser.add_argument("--rows", type=int, default=10_000_000)
+    _ = parser.add_argument("--distinct", type=int, default=100_000)
+    args = parser.parse_args()
+
+    words = regular_words(args.distinct, random.Random(0))
+    generator = random.Random(0)
+    column = pandas.Series(generator.choices(words, k=args.rows))
+
+    timings: dict[str, float] = {}
+    results = {}
+    for name in ("map", "plural_array"):
+        # A new Pluralizer each time, so neither run benefits from the cache of the other.
+        pluralizer = Pluralizer()
+        started = time.perf_counter()
+        if name == "map":
+            results[name] = column.map(pluralizer.plural)
+        else:
+            results[name] = pluralizer.plural_array(column)
+        timings[name] = time.perf_counter() - started
+
+    assert results["map"].equals(results["plural_array"])
+    for name, elapsed in timings.items():
+        print(f"{name:>12} {elapsed:>8.2f} s {args.rows / elapsed:>12.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,13 @@
 __license__ = "MIT"
 
-from .pluralizer import Pluralizer
+from .pluralizer import (
+    Pluralizer,
+    default_pluralizer,
+    is_plural,
+    is_singular,
+    plural,
+    pluralize,
+    singular,
+)
 
-__all__ = ["Pluralizer"]
+__all__ = ["Pluralizer", "default_pluralizer", "is_plural", "is_singular", "plural", "pluralize", "singular"]
@@ -0,0 +1,417 @@
+import re
+from typing import TYPE_CHECKING, Any, Collection, Iterable, Sequence
+
+if TYPE_CHECKING:
+    import sre_compile
+    import sre_parse
+else:
+    try:
+        from re import _compiler as sre_compile
+    except ImportError:  # pragma: no cover - Python 3.10
+        import sre_compile
+    try:
+        from re import _parser as sre_parse
+    except ImportError:  # pragma: no cover - Python 3.10
+        import sre_parse
+
+# The automaton only reads ASCII words. Each character set of a rule is reduced to its ASCII members.
+ALPHABET = tuple(chr(code) for code in range(128))
+# Rule sets compiling to larger automata are searched with regexes, see `compile_automaton`.
+MAX_STATES = 20_000
+# Bounded repeats, e.g. `a{2,5}`, are unrolled, up to this many copies.
+MAX_REPEAT = 16
+
+_BEGIN_ANCHORS = (sre_parse.AT_BEGINNING, sre_parse.AT_BEGINNING_STRING)
+_END_ANCHORS = (sre_parse.AT_END, sre_parse.AT_END_STRING)
+# Possessive repeats may fail where a greedy repeat would match, so they are left to regexes.
+_REPEATS = (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT)
+_CHARACTERS = (sre_parse.LITERAL, sre_parse.NOT_LITERAL, sre_parse.IN, sre_parse.ANY)
+# Items which only restrict where the rest of a pattern matches. Ignoring them approximates a rule by a
+# pattern matching more words, see `_ReversedNFA.add_rule`.
+_ASSERTIONS = (sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT)
+# Possessive repeats and atomic groups, since Python 3.11.
+_POSSESSIVE_REPEATS = tuple(getattr(sre_parse, name) for name in ("POSSESSIVE_REPEAT",) if hasattr(sre_parse, name))
+_ATOMIC_GROUPS = tuple(getattr(sre_parse, name) for name in ("ATOMIC_GROUP",) if hasattr(sre_parse, name))
+
+
+class _Unsupported(Exception):
+    """Raised when a rule can't be compiled into the automaton."""
+
+
+class _TooLarge(Exception):
+    """Raised when the automaton of a rule set would have more than MAX_STATES states."""
+
+
+def _ascii_members(parsed: Any, op: Any, av: Any) -> frozenset[str]:
+    """Return the ASCII characters matched by a single character item, compiling it alone to test them."""
+    matcher = sre_compile.compile(sre_parse.SubPattern(parsed.state, [(op, av)]), parsed.state.flags)
+    return frozenset(char for char in ALPHABET if matcher.fullmatch(char))
+
+
+class _ReversedNFA:
+    """A nondeterministic automaton reading the suffixes of words right to left, built from parsed rules."""
+
+    def __init__(self):
+        super().__init__()
+
+        # The character moves and empty moves leaving each state, and the rule each state belongs to.
+        self.moves: list[list[tuple[frozenset[str], int]]] = []
+        self.epsilons: list[list[int]] = []
+        self.owners: list[int] = []
+        # The accepting states, with their rule, whether the rule is anchored to the start of the word, and
+        # whether the rule is approximated.
+        self.accepting: dict[int, tuple[int, bool, bool]] = {}
+        self.start = self._state(-1)
+        self._characters: dict[tuple[str, int], frozenset[str]] = {}
+        self._owner = -1
+        self._approximate = False
+
+    def _state(self, owner: int) -> int:
+        if len(self.moves) >= MAX_STATES:
+            raise _TooLarge
+        self.moves.append([])
+        self.epsilons.append([])
+        self.owners.append(owner)
+        return len(self.moves) - 1
+
+    def add_rule(self, position: int, pattern: re.Pattern[str], approximate: bool = False) -> None:
+        """Add a rule anchored to the end of the word, raising _Unsupported if it can't be compiled.
+
+        An approximated rule ignores assertions, such as `\\b` or lookarounds, and reads possessive repeats
+        and atomic groups like greedy ones. It accepts every word the rule matches, and maybe more.
+        """
+        if pattern.flags & (re.MULTILINE | re.LOCALE):
+            raise _Unsupported
+
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+        items: list[tuple[Any, Any]] = list(parsed.data)
+        if not items or items[-1][0] is not sre_parse.AT or items[-1][1] not in _END_ANCHORS:
+            raise _Unsupported
+        items = items[:-1]
+
+        anchored = bool(items) and items[0][0] is sre_parse.AT and items[0][1] in _BEGIN_ANCHORS
+        if anchored:
+            items = items[1:]
+
+        self._owner = position
+        self._approximate = approximate
+        start = self._state(position)
+        end = self._sequence(parsed, items, start)
+        self.accepting[end] = (position, anchored, approximate)
+        # Only linked once the whole rule compiled.
+        self.epsilons[self.start].append(start)
+
+    def _sequence(self, parsed: Any, items: Sequence[tuple[Any, Any]], state: int) -> int:
+        """Add moves reading the items backwards from a state, returning the state reached."""
+        for op, av in reversed(items):
+            state = self._item(parsed, op, av, state)
+        return state
+
+    def _item(self, parsed: Any, op: Any, av: Any, state: int) -> int:
+        if op in _CHARACTERS:
+            end = self._state(self._owner)
+            self.moves[state].append((self._members(parsed, op, av), end))
+            return end
+
+        if op is sre_parse.SUBPATTERN:
+            if av[1] or av[2]:
+                # Scoped flags, e.g. `(?-i:...)`.
+                raise _Unsupported
+            return self._sequence(parsed, av[-1], state)
+
+        # An approximated atomic group is read like a group of a single alternative.
+        if op is sre_parse.BRANCH or (self._approximate and op in _ATOMIC_GROUPS):
+            end = self._state(self._owner)
+            for branch in av[1] if op is sre_parse.BRANCH else [av]:
+                self.epsilons[self._sequence(parsed, branch, state)].append(end)
+            return end
+
+        # An approximated possessive repeat is read like a greedy one.
+        if op in _REPEATS or (self._approximate and op in _POSSESSIVE_REPEATS):
+            return self._repeat(parsed, av, state)
+
+        if self._approximate and op in _ASSERTIONS:
+            return state
+
+        # Anchors other than the outer ones, word boundaries, lookarounds, back references, ...
+        raise _Unsupported
+
+    def _repeat(self, parsed: Any, av: Any, state: int) -> int:
+        low, high, items = av
+        unbounded = high is sre_parse.MAXREPEAT
+        if low > MAX_REPEAT or (not unbounded and high > MAX_REPEAT):
+            raise _Unsupported
+
+        for _ in range(low):
+            state = self._sequence(parsed, items, state)
+
+        if unbounded:
+            loop = self._state(self._owner)
+            self.epsilons[state].append(loop)
+            self.epsilons[self._sequence(parsed, items, loop)].append(loop)
+            return loop
+
+        end = self._state(self._owner)
+        for _ in range(high - low):
+            self.epsilons[state].append(end)
+            state = self._sequence(parsed, items, state)
+        self.epsilons[state].append(end)
+        return end
+
+    def _members(self, parsed: Any, op: Any, av: Any) -> frozenset[str]:
+        key = (repr((op, av)), parsed.state.flags)
+        members = self._characters.get(key)
+        if members is None:
+            members = self._characters[key] = _ascii_members(parsed, op, av)
+        return members
+
+    def closure(self, states: Iterable[int]) -> frozenset[int]:
+        """Return the states reachable from some states through empty moves."""
+        found = set(states)
+        pending = list(found)
+        epsilons = self.epsilons
+        while pending:
+            for target in epsilons[pending.pop()]:
+                if target not in found:
+                    found.add(target)
+                    pending.append(target)
+        return frozenset(found)
+
+
+class SuffixAutomaton:
+    """A deterministic automaton of the rule patterns anchored to the end of a word, reading words right to left.
+
+    Each state knows the highest priority rule matching the suffix read so far, and the highest priority rule
+    which could still match a longer suffix, so a search stops as soon as the winning rule and its longest
+    suffix are known. The regex of the winning rule is then matched once, from the start of that suffix, to
+    find its groups. Matching the longest suffix gives the same match as `re.search`.
+
+    Rules which can't be compiled exactly, e.g. using `\\b` or lookarounds, are searched with their regex when
+    they have a higher priority than the rule found by the automaton. Most of them are compiled approximately
+    too, and only searched when the automaton found a suffix their approximation accepts. Only ASCII words
+    without a trailing new line can be searched, see `RuleIndex.search`.
+
+    Rules at `skipped` positions, e.g. rules shadowed by a newer rule with the same pattern, are left out.
+    """
+
+    __slots__ = ("patterns", "transitions", "tops", "anchored_tops", "maybe_tops", "lives", "fallbacks", "approximated")
+
+    def __init__(self, patterns: Sequence[re.Pattern[str]], skipped: Collection[int] = ()):
+        super().__init__()
+
+        nfa = _ReversedNFA()
+        fallbacks: list[int] = []
+        approximated: set[int] = set()
+        for position, pattern in enumerate(patterns):
+            if position in skipped:
+                continue
+            try:
+                nfa.add_rule(position, pattern)
+                continue
+            except _Unsupported:
+                fallbacks.append(position)
+            try:
+                nfa.add_rule(position, pattern, approximate=True)
+                approximated.add(position)
+            except _Unsupported:
+                pass
+
+        self.patterns: tuple[re.Pattern[str], ...] = tuple(patterns)
+        # Highest priority first.
+        self.fallbacks: tuple[int, ...] = tuple(reversed(fallbacks))
+        self.approximated: frozenset[int] = frozenset(approximated)
+        # For each state, its moves, the highest priority rule it accepts anywhere and at the start of the word,
+        # the highest priority approximated rule it accepts, and the highest priority rule with a state which
+        # can still read more characters.
+        self.transitions: list[dict[str, int]] = []
+        self.tops: list[int] = []
+        self.anchored_tops: list[int] = []
+        self.maybe_tops: list[int] = []
+        self.lives: list[int] = []
+        self._determinize(nfa)
+
+    def _determinize(self, nfa: _ReversedNFA) -> None:
+        """Build the deterministic states by subset construction, over classes of interchangeable characters."""
+        sets = sorted({members for moves in nfa.moves for members, _ in moves}, key=sorted)
+        classes: dict[tuple[bool, ...], list[str]] = {}
+        for char in ALPHABET:
+            classes.setdefault(tuple(char in members for members in sets), []).append(char)
+        representatives = [(chars[0], chars) for signature, chars in classes.items() if any(signature)]
+
+        start = nfa.closure([nfa.start])
+        ids = {start: 0}
+        pending = [start]
+        self._add_state(nfa, start)
+        while pending:
+            states = pending.pop()
+            transitions = self.transitions[ids[states]]
+            for representative, chars in representatives:
+                targets = nfa.closure(
+                    target for state in states for members, target in nfa.moves[state] if representative in members
+                )
+                if not targets:
+                    continue
+                target = ids.get(targets)
+                if target is None:
+                    if len(ids) >= MAX_STATES:
+                        raise _TooLarge
+                    target = ids[targets] = len(ids)
+                    pending.append(targets)
+                    self._add_state(nfa, targets)
+                for char in chars:
+                    transitions[char] = target
+
+    def _add_state(self, nfa: _ReversedNFA, states: frozenset[int]) -> None:
+        accepted = [nfa.accepting[state] for state in states if state in nfa.accepting]
+        self.transitions.append({})
+        self.tops.append(
+            max((rule for rule, anchored, approximate in accepted if not anchored | approximate), default=-1)
+        )
+        self.anchored_tops.append(max((rule for rule, _, approximate in accepted if not approximate), default=-1))
+        # Approximated rules are only searched when accepted, wherever the match starts.
+        self.maybe_tops.append(max((rule for rule, _, approximate in accepted if approximate), default=-1))
+        self.lives.append(max((nfa.owners[state] for state in states if nfa.moves[state]), default=-1))
+
+    def locate(self, word: str) -> tuple[int, int, re.Match[str] | None] | None:
+        """Find the highest priority rule matching an ASCII word, without matching its regex.
+
+        Returns the position of the rule and the start of its match, with the match itself when the rule is
+        one of the fallbacks, whose regex had to be searched.
+        """
+        transitions = self.transitions
+        tops = self.tops
+        maybe_tops = self.maybe_tops
+        lives = self.lives
+
+        state = 0
+        best = maybe = -1
+        start = index = len(word)
+        while True:
+            top = tops[state]
+            if top >= best:
+                best = top
+                start = index
+            if maybe_tops[state] > maybe:
+                maybe = maybe_tops[state]
+            # No rule which could still match beats the best one, or extends its match.
+            if index == 0 or lives[state] < best:
+                break
+            index -= 1
+            state = transitions[state].get(word[index], -1)
+            if state < 0:
+                break
+
+        if index == 0 and state >= 0 and self.anchored_tops[state] >= best:
+            best = self.anchored_tops[state]
+            start = 0
+
+        patterns = self.patterns
+        approximated = self.approximated
+        for position in self.fallbacks:
+            if position < best:
+                break
+            if position > maybe and position in approximated:
+                continue
+            match = patterns[position].search(word)
+            if match:
+                return position, match.start(), match
+
+        if best < 0:
+            return None
+        return best, start, None
+
+    def match(self, position: int, word: str, start: int) -> re.Match[str]:
+        """Match the regex of a rule located by `locate`, to find its groups."""
+        match = self.patterns[position].match(word, start)
+        assert match is not None, "the automaton and the regex disagree"
+        return match
+
+    def search(self, word: str) -> tuple[int, re.Match[str]] | None:
+        """Find the highest priority rule matching an ASCII word, returning its position and the match."""
+        found = self.locate(word)
+        if found is None:
+            return None
+
+        position, start, match = found
+        return position, match or self.match(position, word, start)
+
+
+def _sequence_words(parsed: Any, items: Sequence[tuple[Any, Any]], limit: int) -> set[str] | None:
+    words = {""}
+    for op, av in items:
+        endings = _item_words(parsed, op, av, limit)
+        if endings is None:
+            return None
+        words = {word + ending for word in words for ending in endings}
+        if len(words) > limit:
+            return None
+    return words
+
+
+def _item_words(parsed: Any, op: Any, av: Any, limit: int) -> set[str] | None:
+    if op is sre_parse.LITERAL:
+        return {chr(av).lower()} if av < 128 else None
+
+    if op is sre_parse.IN:
+        # Other character items, e.g. `.`, `[^a]` or `\d`, match non ASCII characters.
+        if not all(
+            (kind is sre_parse.LITERAL and value < 128) or (kind is sre_parse.RANGE and value[1] < 128)
+            for kind, value in av
+        ):
+            return None
+        return {char.lower() for char in _ascii_members(parsed, op, av)}
+
+    if op is sre_parse.SUBPATTERN:
+        # Scoped flags, e.g. `(?-i:...)`, would change the members of the characters.
+        return None if av[1] or av[2] else _sequence_words(parsed, av[-1], limit)
+
+    if op is sre_parse.BRANCH:
+        words: set[str] = set()
+        for branch in av[1]:
+            found = _sequence_words(parsed, branch, limit)
+            if found is None:
+                return None
+            words |= found
+        return words
+
+    if op in _REPEATS:
+        low, high, items = av
+        if high is sre_parse.MAXREPEAT or high > MAX_REPEAT:
+            return None
+        words = set()
+        for count in range(low, high + 1):
+            found = _sequence_words(parsed, list(items) * count, limit)
+            if found is None:
+                return None
+            words |= found
+        return words
+
+    return None
+
+
+def whole_words(pattern: re.Pattern[str], limit: int) -> set[str] | None:
+    """Return the lower cased ASCII words fully matched by a pattern anchored to both ends of the word.
+
+    Returns None when the pattern is not anchored to both ends, can't be analysed, may match non ASCII characters,
+    or matches more than `limit` words. Still, under IGNORECASE a few non ASCII characters match ASCII letters,
+    such as "ſ" for "s", and `$` matches before a trailing new line.
+    """
+    if pattern.flags & (re.MULTILINE | re.LOCALE):
+        return None
+
+    parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    items: list[tuple[Any, Any]] = list(parsed.data)
+    if len(items) < 2 or items[0][0] is not sre_parse.AT or items[0][1] not in _BEGIN_ANCHORS:
+        return None
+    if items[-1][0] is not sre_parse.AT or items[-1][1] not in _END_ANCHORS:
+        return None
+
+    return _sequence_words(parsed, items[1:-1], limit)
+
+
+def compile_automaton(patterns: Sequence[re.Pattern[str]], skipped: Collection[int] = ()) -> SuffixAutomaton | None:
+    """Compile the rule patterns into a SuffixAutomaton, or return None if it would have more than MAX_STATES states."""
+    try:
+        return SuffixAutomaton(patterns, skipped)
+    except _TooLarge:
+        return None
@@ -0,0 +1,82 @@
+from typing import Generic, Hashable, NamedTuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a LRUCache, in the same shape as functools.lru_cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[K, V]):
+    """A bounded mapping which evicts the least recently used entry once it is full.
+
+    The entries are kept in a plain dict, which preserves insertion order, so the
+    first key is always the least recently used one. Every operation is a single
+    dict call, which keeps the cache safe to share between threads without a lock.
+    The hit and miss counters are not synchronised and may be approximate under
+    concurrent use.
+
+    A cache with maxsize 0 never stores anything and only counts misses.
+    """
+
+    __slots__ = ("_data", "maxsize", "hits", "misses")
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+
+        if maxsize < 0:
+            raise ValueError(f"maxsize must not be negative, got {maxsize}")
+
+        self._data: dict[K, V] = {}
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value and mark it as the most recently used, or None if it is not cached."""
+        try:
+            value = self._data.pop(key)
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self._data[key] = value
+        self.hits += 1
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entry when the cache is full."""
+        if not self.maxsize:
+            return
+
+        data = self._data
+        data[key] = value
+        if len(data) > self.maxsize:
+            try:
+                del data[next(iter(data))]
+            except (KeyError, RuntimeError, StopIteration):  # pragma: no cover
+                # Another thread evicted or cleared concurrently.
+                pass
+
+    def clear(self) -> None:
+        """Drop every entry, keeping the counters."""
+        self._data.clear()
+
+    def reset(self) -> None:
+        """Drop every entry and reset the counters."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Report the hit and miss counters, the size limit and the current size."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
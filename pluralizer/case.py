@@ -0,0 +1,70 @@
+import re
+from enum import Enum
+
+
+class CaseShape(Enum):
+    """How a word is capitalised, which decides the case given to its replacement."""
+
+    # "hello", and words without any cased character.
+    LOWER = "lower"
+    # "WHISKY".
+    UPPER = "upper"
+    # "Title", and other mixed case words starting with an upper case or uncased character.
+    TITLE = "title"
+    # "tEST", any other mixed case word.
+    MIXED = "mixed"
+
+
+LOWER = CaseShape.LOWER
+UPPER = CaseShape.UPPER
+TITLE = CaseShape.TITLE
+MIXED = CaseShape.MIXED
+
+_ASCII_LETTER = re.compile("[A-Za-z]")
+
+
+def case_shape(word: str) -> CaseShape:
+    """Classify the capitalisation of a word.
+
+    ASCII words, the vast majority, are classified with `str.islower` and `str.isupper`, which only scan the word.
+    Other words are compared with their lower and upper cased copies, as Unicode case mappings may change the
+    length of a word.
+    """
+    if word.isascii():
+        if word.islower():
+            return LOWER
+        if word.isupper():
+            return UPPER
+        # Mixed case, or without any letter.
+        first = word[:1]
+        if first.isupper():
+            return TITLE
+        if first.islower():
+            return MIXED
+        return TITLE if _ASCII_LETTER.search(word) else LOWER
+
+    if word == word.lower():
+        return LOWER
+    if word == word.upper():
+        return UPPER
+    if word[0] == word[0].upper():
+        return TITLE
+    return MIXED
+
+
+def restore_case(shape: CaseShape, word: str, token: str) -> str:
+    """Give a token the capitalisation of a word of the given shape."""
+    # Tokens are an exact match.
+    if word == token:
+        return token
+
+    if shape is LOWER or shape is MIXED:
+        # Irregular words and replacements are usually lower case already.
+        return token if token.isascii() and token.islower() else token.lower()
+
+    if shape is UPPER:
+        return token.upper()
+
+    if token.isascii():
+        return token.capitalize()
+    return token[0].upper() + token[1:].lower()
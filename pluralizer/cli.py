@@ -0,0 +1,187 @@
+import argparse
+import csv
+import itertools
+import os
+import sys
+from typing import Callable, Iterable, Iterator, Sequence, TextIO, TypeVar
+
+from .pluralizer import DEFAULT_CACHE_SIZE, DEFAULT_CHUNK_SIZE, Pluralizer
+
+T = TypeVar("T")
+
+COMMANDS = ("plural", "singular", "is-plural", "is-singular")
+
+USAGE_EXAMPLES = """
+examples:
+  pluralizer plural words.txt > plurals.txt
+  cut -f2 products.tsv | pluralizer singular
+  pluralizer plural --column 2 products.tsv
+  pluralizer is-plural --csv --column 3 --header --append orders.csv
+"""
+
+
+def _batches(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def _inflector(pluralizer: Pluralizer, command: str) -> Callable[[list[str]], list[str]]:
+    """Return a function inflecting a batch of words into output fields.
+
+    Each distinct word of a batch is looked up in the result cache of the Pluralizer, so words repeated across
+    batches are only inflected again once evicted.
+    """
+    methods: dict[str, Callable[[str], str | bool]] = {
+        "plural": pluralizer.plural,
+        "singular": pluralizer.singular,
+        "is-plural": pluralizer.is_plural,
+        "is-singular": pluralizer.is_singular,
+    }
+    inflect = methods[command]
+
+    def inflect_batch(words: list[str]) -> list[str]:
+        results: dict[str, str] = {}
+        for word in words:
+            if word not in results:
+                result = inflect(word)
+                results[word] = result if isinstance(result, str) else "true" if result else "false"
+        return [results[word] for word in words]
+
+    return inflect_batch
+
+
+def _inflect_rows(
+    inflect: Callable[[list[str]], list[str]],
+    rows: Iterable[list[str]],
+    column: int,
+    append: bool,
+    batch_size: int,
+) -> Iterator[list[list[str]]]:
+    """Inflect one column of each row, replacing it or appending the result, yielding one batch of rows at a time."""
+    for batch in _batches(rows, batch_size):
+        # Rows too short to have the column are written unchanged.
+        targets = [row for row in batch if len(row) > column]
+        for row, result in zip(targets, inflect([row[column] for row in targets])):
+            if append:
+                row.append(result)
+            else:
+                row[column] = result
+        yield batch
+
+
+def _inflect_lines(
+    inflect: Callable[[list[str]], list[str]], lines: Iterable[str], append: bool, batch_size: int
+) -> Iterator[str]:
+    """Inflect whole lines, a batch at a time, yielding one chunk of output per batch."""
+    for batch in _batches(lines, batch_size):
+        words = [line.rstrip("\r\n") for line in batch]
+        results = inflect(words)
+        if append:
+            results = [f"{word}\t{result}" for word, result in zip(words, results)]
+        yield "\n".join(results) + "\n"
+
+
+def _open_inputs(paths: Sequence[str], encoding: str) -> Iterator[TextIO]:
+    """Open the input files one after the other, "-" being stdin."""
+    for path in paths or ["-"]:
+        if path == "-":
+            yield sys.stdin
+        else:
+            with open(path, encoding=encoding, newline="") as file:
+                yield file
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pluralizer",
+        description="Pluralize or singularize words read line by line from files or stdin.",
+        epilog=USAGE_EXAMPLES,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    _ = parser.add_argument("command", choices=COMMANDS, help="what to do with each word")
+    _ = parser.add_argument("files", nargs="*", help='files to read, stdin if none or "-"')
+    _ = parser.add_argument("--column", type=int, help="inflect this column (1 based) of delimited lines")
+    _ = parser.add_argument("--delimiter", help="column delimiter, a tab by default, or a comma with --csv")
+    _ = parser.add_argument("--csv", action="store_true", help="parse and write the lines as CSV")
+    _ = parser.add_argument("--header", action="store_true", help="copy the first line of each input unchanged")
+    _ = parser.add_argument("--append", action="store_true", help="append the result rather than replace the word")
+    _ = parser.add_argument("--encoding", default="utf-8", help="encoding of the input files, utf-8 by default")
+    _ = parser.add_argument("--batch-size", type=int, default=DEFAULT_CHUNK_SIZE, help="lines inflected at once")
+    _ = parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE, help="results cached across batches")
+    return parser
+
+
+def _read_rows(args: argparse.Namespace, file: TextIO) -> Iterator[list[str]]:
+    delimiter: str = args.delimiter
+    if args.csv:
+        return csv.reader(file, delimiter=delimiter)
+    return (line.rstrip("\r\n").split(delimiter) for line in file)
+
+
+def _row_writer(args: argparse.Namespace, output: TextIO) -> Callable[[list[list[str]]], None]:
+    delimiter: str = args.delimiter
+    if args.csv:
+        writer = csv.writer(output, delimiter=delimiter, lineterminator="\n")
+        return writer.writerows
+
+    def write_rows(rows: list[list[str]]) -> None:
+        _ = output.write("".join(delimiter.join(row) + "\n" for row in rows))
+
+    return write_rows
+
+
+def _run(args: argparse.Namespace, output: TextIO) -> None:
+    inflect = _inflector(Pluralizer(cache_size=args.cache_size), args.command)
+    column: int | None = args.column - 1 if args.column else None
+    if args.csv and column is None:
+        column = 0
+
+    for file in _open_inputs(args.files, args.encoding):
+        if column is None:
+            if args.header:
+                for header in itertools.islice(file, 1):
+                    header = header.rstrip("\r\n")
+                    _ = output.write(f"{header}\t{args.command}\n" if args.append else f"{header}\n")
+            for chunk in _inflect_lines(inflect, file, args.append, args.batch_size):
+                _ = output.write(chunk)
+            continue
+
+        rows = _read_rows(args, file)
+        write_rows = _row_writer(args, output)
+        if args.header:
+            for header in itertools.islice(rows, 1):
+                write_rows([header + [args.command] if args.append else header])
+        for batch in _inflect_rows(inflect, rows, column, args.append, args.batch_size):
+            write_rows(batch)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line tool, returning its exit status."""
+    parser = _parser()
+    args = parser.parse_intermixed_args(argv)
+    if args.column is not None and args.column < 1:
+        parser.error("--column must be 1 or more")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be 1 or more")
+    if args.cache_size < 0:
+        parser.error("--cache-size must not be negative")
+    if args.delimiter is None:
+        args.delimiter = "," if args.csv else "\t"
+    if not args.delimiter:
+        parser.error("--delimiter must not be empty")
+    if args.csv and len(args.delimiter) != 1:
+        parser.error("--delimiter must be a single character with --csv")
+
+    try:
+        _run(args, sys.stdout)
+        _ = sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader, e.g. `head`, stopped early. Silence the error Python reports when flushing at exit.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        _ = os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except OSError as error:
+        parser.exit(1, f"{parser.prog}: error: {error}\n")
+
+    return 0
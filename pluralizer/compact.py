@@ -0,0 +1,189 @@
+import sys
+from array import array
+from typing import Any, Iterable, Iterator, Protocol
+
+# The low 32 bits of each key's hash are kept, to skip comparing most keys which share a slot.
+_HASH_MASK = 0xFFFFFFFF
+
+
+class WordMap(Protocol):
+    """The read-only part of a dict of words used to inflect them, implemented by dict and CompactMap."""
+
+    def __contains__(self, word: object, /) -> bool: ...
+
+    def __getitem__(self, word: str, /) -> str: ...
+
+    def items(self) -> Iterable[tuple[str, str]]: ...
+
+
+class CompactWords:
+    """An immutable pool of distinct words, concatenated into a single string.
+
+    Each word is identified by its position in the pool and read back by slicing the string, so
+    tables of words can be stored as arrays of 32 bit integers rather than of str objects.
+    """
+
+    __slots__ = ("_text", "_offsets", "_positions")
+
+    def __init__(self, words: Iterable[str]):
+        super().__init__()
+
+        ordered = sorted(set(words))
+        offsets = array("I", [0])
+        position = 0
+        for word in ordered:
+            position += len(word)
+            offsets.append(position)
+
+        self._text = "".join(ordered)
+        self._offsets = offsets
+        # Only needed while tables are built from this pool, see `release`.
+        self._positions: dict[str, int] | None = {word: position for position, word in enumerate(ordered)}
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def position(self, word: str) -> int:
+        """Return the position of a word, while the pool is used to build tables."""
+        assert self._positions is not None, "the pool was released"
+        return self._positions[word]
+
+    def word(self, position: int) -> str:
+        """Return the word at a position."""
+        offsets = self._offsets
+        return self._text[offsets[position] : offsets[position + 1]]
+
+    def release(self) -> None:
+        """Drop the index from words to positions once every table is built."""
+        self._positions = None
+
+    def nbytes(self) -> int:
+        """Approximate the memory used by the pool, in bytes."""
+        return sys.getsizeof(self._text) + sys.getsizeof(self._offsets)
+
+
+class _HashIndex:
+    """An open addressing hash table of entries, each being the position of a key in a pool, using linear probing.
+
+    The table depends on the hashes of the keys, which differ between processes, so it is rebuilt when unpickled.
+    """
+
+    __slots__ = ("words", "keys", "hashes", "slots", "mask")
+
+    def __init__(self, words: CompactWords, keys: Iterable[str]):
+        super().__init__()
+
+        self.words = words
+        self.keys = array("I", [words.position(key) for key in keys])
+        self.hashes, self.slots, self.mask = self._hash()
+
+    def __setstate__(self, state: tuple[None, dict[str, Any]]) -> None:
+        for name, value in state[1].items():
+            setattr(self, name, value)
+        self.hashes, self.slots, self.mask = self._hash()
+
+    def _hash(self) -> tuple["array[int]", "array[int]", int]:
+        """Build the hash table of the keys, at most half full."""
+        size = 8
+        while size < 2 * len(self.keys):
+            size *= 2
+        mask = size - 1
+
+        word = self.words.word
+        slots = array("i", [-1]) * size
+        hashes = array("I")
+        for entry, key in enumerate(self.keys):
+            key_hash = hash(word(key))
+            hashes.append(key_hash & _HASH_MASK)
+            slot = key_hash & mask
+            while slots[slot] >= 0:
+                slot = (slot + 1) & mask
+            slots[slot] = entry
+
+        return hashes, slots, mask
+
+    def find(self, word: str) -> int:
+        """Return the entry of a key, or -1 if it is missing."""
+        key_hash = hash(word)
+        mask = self.mask
+        slots = self.slots
+        slot = key_hash & mask
+        entry = slots[slot]
+        if entry < 0:
+            return -1
+
+        check = key_hash & _HASH_MASK
+        hashes = self.hashes
+        keys = self.keys
+        word_at = self.words.word
+        while entry >= 0:
+            if hashes[entry] == check and word_at(keys[entry]) == word:
+                return entry
+            slot = (slot + 1) & mask
+            entry = slots[slot]
+        return -1
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self.keys) + sys.getsizeof(self.hashes) + sys.getsizeof(self.slots)
+
+
+class CompactSet:
+    """An immutable set of words stored as positions in a CompactWords pool."""
+
+    __slots__ = ("_index",)
+
+    def __init__(self, words: CompactWords, members: Iterable[str]):
+        super().__init__()
+
+        self._index = _HashIndex(words, dict.fromkeys(members))
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self._index.find(word) >= 0
+
+    def __len__(self) -> int:
+        return len(self._index.keys)
+
+    def __iter__(self) -> Iterator[str]:
+        word = self._index.words.word
+        return (word(key) for key in self._index.keys)
+
+    def nbytes(self) -> int:
+        """Approximate the memory used by the set, excluding the words of the pool, in bytes."""
+        return self._index.nbytes()
+
+
+class CompactMap:
+    """An immutable mapping from words to words stored as positions in a CompactWords pool.
+
+    Lookups hash the word and compare it with the pooled keys sharing its slot, in constant time
+    on average. It implements the parts of a dict used by Pluralizer, see WordMap.
+    """
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, words: CompactWords, mapping: WordMap):
+        super().__init__()
+
+        items = list(mapping.items())
+        self._index = _HashIndex(words, [key for key, _ in items])
+        self._values = array("I", [words.position(value) for _, value in items])
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self._index.find(word) >= 0
+
+    def __getitem__(self, word: str) -> str:
+        entry = self._index.find(word)
+        if entry < 0:
+            raise KeyError(word)
+        return self._index.words.word(self._values[entry])
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def items(self) -> Iterator[tuple[str, str]]:
+        word = self._index.words.word
+        return ((word(key), word(value)) for key, value in zip(self._index.keys, self._values))
+
+    def nbytes(self) -> int:
+        """Approximate the memory used by the mapping, excluding the words of the pool, in bytes."""
+        return self._index.nbytes() + sys.getsizeof(self._values)
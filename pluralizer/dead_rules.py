@@ -0,0 +1,50 @@
+from typing import Collection, NamedTuple, Sequence
+
+from .rule_index import Rule, shadowed_rules
+
+# Rules matching more whole words than this are not compared with the uncountables.
+MAX_WORDS = 1_000
+
+
+class DeadRule(NamedTuple):
+    """A rule which is never applied, see `Pluralizer.dead_rules`.
+
+    `reason` is "duplicate" when the newer rule at `shadowed_by` has the same pattern and replacement, "overridden"
+    when it has the same pattern and another replacement, and "uncountable" when the ASCII words the rule matches
+    are all uncountables, settled before any rule is tried. Such a rule still matches words with a trailing new line
+    or with non ASCII letters like "ſ", so only the first two are removed by `prune_rules`.
+    """
+
+    position: int
+    pattern: str
+    replacement: str
+    reason: str
+    shadowed_by: int | None
+
+
+class DeadRules(NamedTuple):
+    """The dead rules of a Pluralizer, in the order they were added, like `Pluralizer.pluralRules`."""
+
+    plural_rules: tuple[DeadRule, ...]
+    singular_rules: tuple[DeadRule, ...]
+
+
+def find_dead_rules(rules: Sequence[Rule], uncountables: Collection[str]) -> tuple[DeadRule, ...]:
+    """Find the rules of one kind which are never applied to a word."""
+    from .automaton import whole_words
+
+    shadowed = shadowed_rules(rules)
+    dead: list[DeadRule] = []
+    for position, (pattern, replacement) in enumerate(rules):
+        newer = shadowed.get(position)
+        if newer is not None:
+            reason = "duplicate" if rules[newer][1] == replacement else "overridden"
+            dead.append(DeadRule(position, pattern.pattern, replacement, reason, newer))
+            continue
+
+        words = whole_words(pattern, MAX_WORDS)
+        # Empty words are returned unchanged before any rule is tried, like uncountables.
+        if words is not None and all(not word or word in uncountables for word in words):
+            dead.append(DeadRule(position, pattern.pattern, replacement, "uncountable", None))
+
+    return tuple(dead)
@@ -0,0 +1,44 @@
+from typing import Any, Iterable
+
+
+class CountFormatter:
+    """Formats a word for counts like `Pluralizer.pluralize`, with both of its forms inflected up front.
+
+    Calling it with a count returns the singular form for a count of 1 and the plural form otherwise,
+    prefixed with the count when `inclusive`, without evaluating any rule. The forms are the ones of the
+    rules when it was created, see `Pluralizer.formatter`.
+    """
+
+    __slots__ = ("singular", "plural", "inclusive", "_one", "_other")
+
+    def __init__(self, singular: str, plural: str, inclusive: bool = False):
+        super().__init__()
+
+        self.singular = singular
+        self.plural = plural
+        self.inclusive = inclusive
+        # What follows the count, or the whole phrase when the count is not included.
+        self._one = " " + singular if inclusive else singular
+        self._other = " " + plural if inclusive else plural
+
+    def __call__(self, count: int | None = None) -> str:
+        suffix = self._one if count == 1 else self._other
+        return str(count) + suffix if self.inclusive else suffix
+
+    def format_many(self, counts: Iterable[int | None]) -> list[str]:
+        """Format many counts, returning a list in the same order."""
+        one = self._one
+        other = self._other
+        if not self.inclusive:
+            return [one if count == 1 else other for count in counts]
+        return [str(count) + (one if count == 1 else other) for count in counts]
+
+    def format_array(self, counts: Any) -> Any:
+        """Format a NumPy array or pandas Series of counts, with NumPy comparisons and string concatenation.
+
+        Returns an array of the same shape holding Python strings, or a Series with the same index and name.
+        Requires NumPy.
+        """
+        from .vectorized import format_counts
+
+        return format_counts(self._one, self._other, counts, self.inclusive)
@@ -1,13 +1,103 @@
+import os
 import re
-from typing import Tuple
+from time import perf_counter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Collection, Iterable, Iterator, NamedTuple, Tuple, TypeVar
 
-from .pluralizer_rules import irregular_rules, pluralization_rules, singularization_rules, uncountable_rules
+from .cache import CacheInfo, LRUCache
+from .case import LOWER, CaseShape, case_shape, restore_case
+from .compact import CompactMap, CompactSet, CompactWords, WordMap
+from .dead_rules import DeadRules, find_dead_rules
+from .formatter import CountFormatter
+from .replacement import Replacement
+from .rule_index import RuleIndex
+from .stats import PluralizerStats, StatsCollector
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# Modules which are slow to import (the default rules compile dozens of regexes, asyncio and
+# concurrent.futures pull in much of the standard library) are imported on first use, so that
+# importing pluralizer stays cheap. tests/test_import.py guards this.
 
 IrregularSingles = dict[str, str]
 IrregularPlurals = dict[str, str]
 SingularRule = Tuple[re.Pattern[str], str]
 PluralRule = Tuple[re.Pattern[str], str]
 
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CHUNK_SIZE = 10_000
+DEFAULT_ASYNC_CHUNK_SIZE = 1_000
+TEXT_SCANNER_CACHE_SIZE = 64
+
+T = TypeVar("T")
+
+# The signatures of `Pluralizer._replace_word` and `Pluralizer._check_word`.
+_ReplaceWord = Callable[["Pluralizer", WordMap, WordMap, RuleIndex, str], str]
+_CheckWord = Callable[["Pluralizer", WordMap, WordMap, RuleIndex, str], bool]
+
+
+class RuleTables(NamedTuple):
+    """A picklable copy of every rule of a Pluralizer."""
+
+    plural_rules: list[PluralRule]
+    singular_rules: list[SingularRule]
+    uncountables: dict[str, bool]
+    irregular_plurals: IrregularPlurals
+    irregular_singles: IrregularSingles
+
+
+class WordAnalysis(NamedTuple):
+    """Both forms of a word, whether it is already in each, and what decided them, see `Pluralizer.analyze`.
+
+    `singular_source` and `plural_source` are "keep" when the word is an irregular word of that form,
+    "irregular" when it is an irregular word of the other form, "uncountable", "rule" when `singular_rule`
+    or `plural_rule` matched it, and "none" when nothing did.
+    """
+
+    word: str
+    singular: str
+    plural: str
+    is_singular: bool
+    is_plural: bool
+    singular_source: str
+    plural_source: str
+    singular_rule: SingularRule | None
+    plural_rule: PluralRule | None
+
+
+class _DefaultRules(NamedTuple):
+    """The compiled default rules, copied into every new Pluralizer."""
+
+    tables: RuleTables
+    plural_index: RuleIndex
+    singular_index: RuleIndex
+
+
+class _Snapshot(NamedTuple):
+    """The content of a file written by `Pluralizer.dump`."""
+
+    tables: RuleTables
+    plural_index: RuleIndex
+    singular_index: RuleIndex
+    frozen: bool
+
+
+class _Precomputed(NamedTuple):
+    """The content of a file written by `Pluralizer.save_precomputed`."""
+
+    fingerprint: str
+    plural_table: dict[str, str]
+    singular_table: dict[str, str]
+
+
+# Compiled by the first Pluralizer of the process, see `Pluralizer.__init__`.
+_default_rules: _DefaultRules | None = None
+# The shared, frozen Pluralizer of the module level functions, see `default_pluralizer`.
+_default_pluralizer: "Pluralizer | None" = None
+# The Pluralizer used by the current process pool worker, see `Pluralizer.plural_parallel`.
+_worker_pluralizer: "Pluralizer | None" = None
+
 
 class Pluralizer:
     """This module uses a pre-defined list of rules, applied in order, to singularize or pluralize a given word.
@@ -29,11 +119,30 @@ class Pluralizer:
         assert pluralizer.is_plural('apple') == False
         assert pluralizer.is_singular('apples') == False
         assert pluralizer.is_singular('apple') == True
+
+    Results of plural, singular, is_plural and is_singular are kept in a bounded LRU cache of
+    `cache_size` entries shared by the four methods, which is cleared whenever a rule is added.
+    Pass `cache_size=0` to disable it.
+
+    Pass `default_rules=False` to start without any rule, e.g. to define a rule set from scratch.
+
+    Adding rules while other threads inflect words is not safe. Add every rule first, then call
+    `freeze` to share the Pluralizer between threads.
     """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE, *, default_rules: bool = True):
         super().__init__()
 
+        self._cache: LRUCache[tuple[str, str], str | bool] = LRUCache(cache_size)
+        # Compiled scanners of pluralize_text / singularize_text, keyed by their target words.
+        self._text_scanners: LRUCache[frozenset[str], re.Pattern[str]] = LRUCache(TEXT_SCANNER_CACHE_SIZE)
+        # Exact results of a known vocabulary, see `precompute`. They are replaced rather than updated, so
+        # a frozen Pluralizer can still be shared between threads.
+        self._plural_table: dict[str, str] = {}
+        self._singular_table: dict[str, str] = {}
+        # Incremented whenever a rule is added, so long lived consumers can tell their results are stale.
+        self._rules_version = 0
+
         # Rule storage - pluralize and singularize need to be run sequentially,
         # while other rules can be optimized using an object for instant lookups.
         self.pluralRules: list[PluralRule] = []
@@ -42,6 +151,48 @@ class Pluralizer:
         self.irregularPlurals: IrregularPlurals = {}
         self.irregularSingles: IrregularSingles = {}
 
+        # The views of the rules used to inflect words. They are the objects above, until `freeze`
+        # replaces them with immutable copies. The sequential rules are looked up through suffix
+        # indexes, which are snapshots rebuilt lazily after a rule is added.
+        self._frozen = False
+        self._uncountables: Collection[str] = self.uncountables
+        self._irregular_plurals: WordMap = self.irregularPlurals
+        self._irregular_singles: WordMap = self.irregularSingles
+        self._plural_index: RuleIndex | None = None
+        self._singular_index: RuleIndex | None = None
+
+        # Words are inflected through the plain functions, which `enable_stats` swaps for counting ones,
+        # so that disabled stats cost nothing.
+        self._stats: StatsCollector | None = None
+        self._replace_word_function: _ReplaceWord = Pluralizer._replace_word
+        self._check_word_function: _CheckWord = Pluralizer._check_word
+
+        if not default_rules:
+            return
+
+        # The default rules are only compiled by the first Pluralizer of the process. Later ones copy
+        # the compiled rules, and share the suffix indexes until a rule is added.
+        global _default_rules
+        defaults = _default_rules
+        if defaults is None:
+            self._add_default_rules()
+            defaults = _default_rules = _DefaultRules(self._rule_tables(), self._plural_rules(), self._singular_rules())
+        else:
+            self._load_rules(defaults.tables, defaults.plural_index, defaults.singular_index)
+
+    def _load_rules(self, tables: RuleTables, plural_index: RuleIndex, singular_index: RuleIndex) -> None:
+        """Copy already validated rules into a Pluralizer without any rule, sharing their suffix indexes."""
+        self.pluralRules.extend(tables.plural_rules)
+        self.singularRules.extend(tables.singular_rules)
+        self.uncountables.update(tables.uncountables)
+        self.irregularPlurals.update(tables.irregular_plurals)
+        self.irregularSingles.update(tables.irregular_singles)
+        self._plural_index = plural_index
+        self._singular_index = singular_index
+
+    def _add_default_rules(self) -> None:
+        from .pluralizer_rules import irregular_rules, pluralization_rules, singularization_rules, uncountable_rules
+
         for single, plural in irregular_rules:
             self.add_irregular_rule(single, plural)
 
@@ -61,100 +212,224 @@ class Pluralizer:
 
         return rule
 
-    def _restore_case(self, word: str, token: str) -> str:
-        """Pass in a word token to produce a function that can replicate the case on another word."""
-        # Tokens are an exact match.
-        if word == token:
-            return token
-
-        # Lower cased words. E.g. "hello".
-        if word == word.lower():
-            return token.lower()
-
-        # Upper cased words. E.g. "WHISKY".
-        if word == word.upper():
-            return token.upper()
-
-        # Title cased words. E.g. "Title".
-        if word[0] == word[0].upper():
-            return token[0].upper() + token[1:].lower()
-
-        # Lower cased words. E.g. "test".
-        return token.lower()
+    def _replace(self, word: str, match: re.Match[str], replacement: Replacement) -> str:
+        """Replace the part of a word matched by a rule."""
+        result = replacement.expand(match)
 
-    def _interpolate(self, s: str, match: re.Match[str]) -> str:
-        """Interpolate a regexp string."""
+        matched_start, matched_end = match.span()
+        # Take the case of the matched part, or of the character before an empty match.
+        matched = word[matched_start - 1] if matched_end == matched_start else match.group(0)
+        result = restore_case(case_shape(matched), matched, result)
 
-        def replace_rest(sub_match: re.Match[str]):
-            return match.group(int(sub_match.group(1))) or ""
+        return word[:matched_start] + result + word[matched_end:]
 
-        return re.sub(r"\$(\d{1,2})", replace_rest, s)
-
-    def _replace(self, word: str, pattern: re.Pattern[str], replacement: str) -> str:
-        """Replace a word using a rule."""
-
-        def replace_(match: re.Match[str]) -> str:
-            result = self._interpolate(replacement, match)
-
-            matched_start, matched_end = match.span()
-            if matched_end == matched_start:
-                return self._restore_case(word[matched_start - 1], result)
-
-            return self._restore_case(match.group(0), result)
-
-        return pattern.sub(replace_, word, 1)
-
-    def _sanitize_word(self, token: str, word: str, rules: list[SingularRule] | list[PluralRule]) -> str:
+    def _sanitize_word(self, token: str, word: str, rules: RuleIndex) -> str:
         """Sanitize a word by passing in the word and sanitization rules."""
         # Empty string or doesn't need fixing.
-        if (not token) or token in self.uncountables:
+        if (not token) or token in self._uncountables:
             return word
 
-        # Iterate over the sanitization rules and use the first one to match.
-        for pattern, replacement in reversed(rules):
-            if pattern.search(word):
-                return self._replace(word, pattern, replacement)
+        # Use the first sanitization rule to match.
+        found = rules.search(word)
+        if found is None:
+            return word
 
-        return word
+        position, match = found
+        return self._replace(word, match, rules.replacements[position])
 
     def _replace_word(
         self,
-        replaceMap: IrregularSingles | IrregularPlurals,
-        keepMap: IrregularSingles | IrregularPlurals,
-        rules: list[SingularRule] | list[PluralRule],
+        replaceMap: WordMap,
+        keepMap: WordMap,
+        rules: RuleIndex,
         word: str,
     ) -> str:
         """Replace a word with the updated word."""
-        # Get the correct token and case restoration functions.
-        token = word.lower()
+        # Classify the case once, lower case words are their own token.
+        shape = case_shape(word)
+        token = word if shape is LOWER else word.lower()
 
         # Check against the keep object map.
         if token in keepMap:
-            return self._restore_case(word, token)
+            return restore_case(shape, word, token)
 
         # Check against the replacement map for a direct word replacement.
         if token in replaceMap:
-            return self._restore_case(word, replaceMap[token])
+            return restore_case(shape, word, replaceMap[token])
 
         # Run all the rules against the word.
         return self._sanitize_word(token, word, rules)
 
     def _check_word(
         self,
-        replaceMap: IrregularSingles | IrregularPlurals,
-        keepMap: IrregularSingles | IrregularPlurals,
-        rules: list[SingularRule] | list[PluralRule],
+        replaceMap: WordMap,
+        keepMap: WordMap,
+        rules: RuleIndex,
         word: str,
     ) -> bool:
         """Check if a word is part of the map."""
-        token = word.lower()
+        token = word if case_shape(word) is LOWER else word.lower()
 
         if token in keepMap:
             return True
         if token in replaceMap:
             return False
+        if (not token) or token in self._uncountables:
+            return True
+
+        # The word is in the checked form if its rule would leave it unchanged, which is decided without
+        # building the replaced word.
+        return rules.keeps(token)
+
+    def _plural_rules(self) -> RuleIndex:
+        """Return the suffix index of the pluralization rules, building it if a rule was added."""
+        index = self._plural_index
+        if index is not None and len(index.rules) != len(self.pluralRules) and not self._frozen:
+            # Rules appended to or removed from `pluralRules` directly.
+            self._rules_changed()
+            index = None
+        if index is None:
+            index = self._plural_index = RuleIndex(self.pluralRules)
+        return index
+
+    def _singular_rules(self) -> RuleIndex:
+        """Return the suffix index of the singularization rules, building it if a rule was added."""
+        index = self._singular_index
+        if index is not None and len(index.rules) != len(self.singularRules) and not self._frozen:
+            # Rules appended to or removed from `singularRules` directly.
+            self._rules_changed()
+            index = None
+        if index is None:
+            index = self._singular_index = RuleIndex(self.singularRules)
+        return index
+
+    def _plural_word(self, word: str) -> str:
+        found = self._plural_table.get(word)
+        if found is not None:
+            return found
 
-        return self._sanitize_word(token, token, rules) == token
+        return self._replace_word_function(
+            self, self._irregular_singles, self._irregular_plurals, self._plural_rules(), word
+        )
+
+    def _is_plural_word(self, word: str) -> bool:
+        return self._check_word_function(
+            self, self._irregular_singles, self._irregular_plurals, self._plural_rules(), word
+        )
+
+    def _singular_word(self, word: str) -> str:
+        found = self._singular_table.get(word)
+        if found is not None:
+            return found
+
+        return self._replace_word_function(
+            self, self._irregular_plurals, self._irregular_singles, self._singular_rules(), word
+        )
+
+    def _is_singular_word(self, word: str) -> bool:
+        return self._check_word_function(
+            self, self._irregular_plurals, self._irregular_singles, self._singular_rules(), word
+        )
+
+    def _sanitize_word_counted(self, stats: StatsCollector, token: str, word: str, rules: RuleIndex) -> str:
+        """Like `_sanitize_word`, counting the rules tried and timing each stage."""
+        started = perf_counter()
+        if (not token) or token in self._uncountables:
+            if token:
+                stats.shortcuts["uncountable"] += 1
+            stats.seconds["lookup"] += perf_counter() - started
+            return word
+
+        counters = stats.plural if rules is self._plural_index else stats.singular
+        tried = counters.tried
+        searched = perf_counter()
+        stats.seconds["lookup"] += searched - started
+        for position in rules.candidates(word):
+            tried[position] = tried.get(position, 0) + 1
+            match = rules.rules[position][0].search(word)
+            if match:
+                counters.matched[position] = counters.matched.get(position, 0) + 1
+                found = perf_counter()
+                stats.seconds["rules"] += found - searched
+                result = self._replace(word, match, rules.replacements[position])
+                stats.seconds["replace"] += perf_counter() - found
+                return result
+
+        stats.seconds["rules"] += perf_counter() - searched
+        return word
+
+    def _replace_word_counted(
+        self,
+        replaceMap: WordMap,
+        keepMap: WordMap,
+        rules: RuleIndex,
+        word: str,
+    ) -> str:
+        """Like `_replace_word`, updating the stats."""
+        stats = self._stats
+        assert stats is not None
+        stats.words += 1
+
+        started = perf_counter()
+        shape = case_shape(word)
+        token = word if shape is LOWER else word.lower()
+        shortcut = "keep" if token in keepMap else "irregular" if token in replaceMap else None
+        stats.seconds["lookup"] += perf_counter() - started
+        if shortcut is None:
+            return self._sanitize_word_counted(stats, token, word, rules)
+
+        stats.shortcuts[shortcut] += 1
+        started = perf_counter()
+        result = restore_case(shape, word, token if shortcut == "keep" else replaceMap[token])
+        stats.seconds["replace"] += perf_counter() - started
+        return result
+
+    def _check_word_counted(
+        self,
+        replaceMap: WordMap,
+        keepMap: WordMap,
+        rules: RuleIndex,
+        word: str,
+    ) -> bool:
+        """Like `_check_word`, updating the stats."""
+        stats = self._stats
+        assert stats is not None
+        stats.words += 1
+
+        started = perf_counter()
+        token = word if case_shape(word) is LOWER else word.lower()
+        shortcut = "keep" if token in keepMap else "irregular" if token in replaceMap else None
+        stats.seconds["lookup"] += perf_counter() - started
+        if shortcut is None:
+            return self._sanitize_word_counted(stats, token, token, rules) == token
+
+        stats.shortcuts[shortcut] += 1
+        return shortcut == "keep"
+
+    def enable_stats(self) -> None:
+        """Start counting how often each rule is tried and matched, and timing each stage, see `stats`.
+
+        Only words missing from the result cache are inflected and counted, create the Pluralizer with
+        `cache_size=0` to count every call. Enabling the stats again resets them, and adding a rule resets the
+        rule counters.
+        """
+        self._stats = StatsCollector()
+        self._replace_word_function = Pluralizer._replace_word_counted
+        self._check_word_function = Pluralizer._check_word_counted
+
+    def disable_stats(self) -> None:
+        """Stop collecting stats and drop them. Words are inflected without any overhead again."""
+        self._stats = None
+        self._replace_word_function = Pluralizer._replace_word
+        self._check_word_function = Pluralizer._check_word
+
+    def stats(self) -> PluralizerStats | None:
+        """Return a snapshot of the stats collected since `enable_stats`, or None when they are disabled."""
+        stats = self._stats
+        if stats is None:
+            return None
+
+        return stats.snapshot(self._plural_rules().rules, self._singular_rules().rules)
 
     def pluralize(self, word: str, count: int | None = None, inclusive: bool = False) -> str:
         """Pluralize or singularize a word based on the passed in count.
@@ -171,34 +446,576 @@ class Pluralizer:
 
         return (str(count) + " " if inclusive else "") + pluralized
 
+    def formatter(self, word: str, inclusive: bool = False) -> CountFormatter:
+        """Inflect a word both ways once, returning a CountFormatter giving the same phrases as `pluralize`.
+
+        Usage:
+            items = pluralizer.formatter('item', inclusive=True)
+            assert items(3) == '3 items'
+            assert items.format_many([1, 2]) == ['1 item', '2 items']
+
+        The formatter keeps the forms of the current rules, it is not updated when a rule is added.
+        """
+        return CountFormatter(self.singular(word), self.plural(word), inclusive)
+
+    def _text_scanner(self, words: Iterable[str]) -> re.Pattern[str] | None:
+        """Compile a regex matching every form of the target words as a whole word, or None without targets."""
+        key = frozenset(word.lower() for word in words if word)
+        if not key:
+            return None
+
+        scanner = self._text_scanners.get(key)
+        if scanner is None:
+            forms = {form for word in key for form in (word, self.plural(word).lower(), self.singular(word).lower())}
+            forms.discard("")
+            # Longest first, so "items" is preferred over "item". Word characters, including digits and
+            # underscores, must not touch the match on either side, so identifiers such as "item_id" are kept.
+            alternatives = "|".join(re.escape(form) for form in sorted(forms, key=len, reverse=True))
+            scanner = re.compile(r"(?<!\w)(?:" + alternatives + r")(?!\w)", re.IGNORECASE)
+            self._text_scanners.put(key, scanner)
+
+        return scanner
+
+    def _inflect_text(self, text: str, words: Iterable[str], inflect: Callable[[str], str]) -> str:
+        """Inflect every occurrence of the target words in a text in one scan, leaving everything else untouched."""
+        scanner = self._text_scanner(words)
+        if scanner is None:
+            return text
+
+        inflected: dict[str, str] = {}
+
+        def replace(match: re.Match[str]) -> str:
+            token = match.group(0)
+            result = inflected.get(token)
+            if result is None:
+                result = inflected[token] = inflect(token)
+            return result
+
+        return scanner.sub(replace, text)
+
+    def pluralize_text(self, text: str, count: int | None, words: Iterable[str]) -> str:
+        """Pluralize or singularize, based on count, every occurrence of the given words in a text.
+
+        Each of `words` matches its singular and plural forms as whole words, case insensitively. Matches
+        are replaced like `pluralize`, keeping their case, while punctuation and other words are kept as is:
+
+            assert pluralizer.pluralize_text('Found 2 Item, 1 box.', 2, ['item']) == 'Found 2 Items, 1 box.'
+        """
+        return self._inflect_text(text, words, self.singular if count == 1 else self.plural)
+
+    def singularize_text(self, text: str, words: Iterable[str]) -> str:
+        """Singularize every occurrence of the given words in a text, see `pluralize_text`."""
+        return self._inflect_text(text, words, self.singular)
+
     def plural(self, word: str) -> str:
         """Pluralize a word."""
-        return self._replace_word(self.irregularSingles, self.irregularPlurals, self.pluralRules, word)
+        key = ("plural", word)
+        cached = self._cache.get(key)
+        if isinstance(cached, str):
+            return cached
+
+        result = self._plural_word(word)
+        self._cache.put(key, result)
+        return result
 
     def is_plural(self, word: str) -> bool:
         """Check if a word is plural."""
-        return self._check_word(self.irregularSingles, self.irregularPlurals, self.pluralRules, word)
+        key = ("is_plural", word)
+        cached = self._cache.get(key)
+        if isinstance(cached, bool):
+            return cached
+
+        result = self._is_plural_word(word)
+        self._cache.put(key, result)
+        return result
 
     def singular(self, word: str) -> str:
         """Singular a word."""
-        return self._replace_word(self.irregularPlurals, self.irregularSingles, self.singularRules, word)
+        key = ("singular", word)
+        cached = self._cache.get(key)
+        if isinstance(cached, str):
+            return cached
 
-    def is_singular(self, word: str):
+        result = self._singular_word(word)
+        self._cache.put(key, result)
+        return result
+
+    def is_singular(self, word: str) -> bool:
         """Check if a word is singular."""
-        return self._check_word(self.irregularPlurals, self.irregularSingles, self.singularRules, word)
+        key = ("is_singular", word)
+        cached = self._cache.get(key)
+        if isinstance(cached, bool):
+            return cached
+
+        result = self._is_singular_word(word)
+        self._cache.put(key, result)
+        return result
+
+    def _inflect_distinct(self, inflect: Callable[[str], T], words: Iterable[str]) -> dict[str, T]:
+        """Run a word through `inflect` once per distinct word, bypassing the result cache."""
+        results: dict[str, T] = {}
+        for word in words:
+            if word not in results:
+                results[word] = inflect(word)
+
+        return results
+
+    def analyze(self, word: str) -> WordAnalysis:
+        """Find both forms of a word and whether it is already in each, in one pass.
+
+        Gives the same results as `singular`, `plural`, `is_singular` and `is_plural`, sharing the case
+        classification and the irregular and uncountable lookups between them. The result cache and the
+        stats are not used.
+        """
+        shape = case_shape(word)
+        token = word if shape is LOWER else word.lower()
+        singular, is_singular, singular_source, singular_rule = self._analyze_form(
+            self._irregular_plurals, self._irregular_singles, self._singular_rules(), word, shape, token
+        )
+        plural, is_plural, plural_source, plural_rule = self._analyze_form(
+            self._irregular_singles, self._irregular_plurals, self._plural_rules(), word, shape, token
+        )
+        return WordAnalysis(
+            word, singular, plural, is_singular, is_plural, singular_source, plural_source, singular_rule, plural_rule
+        )
+
+    def _analyze_form(
+        self, replaceMap: WordMap, keepMap: WordMap, rules: RuleIndex, word: str, shape: CaseShape, token: str
+    ) -> tuple[str, bool, str, PluralRule | None]:
+        """Like `_replace_word` and `_check_word` together, also returning what decided the form."""
+        if token in keepMap:
+            return restore_case(shape, word, token), True, "keep", None
+        if token in replaceMap:
+            return restore_case(shape, word, replaceMap[token]), False, "irregular", None
+        if not token:
+            return word, True, "none", None
+        if token in self._uncountables:
+            return word, True, "uncountable", None
+
+        # The match of an ASCII word by case insensitive rules has the same spans as the match of its token.
+        same_match = token is word or (rules.ignores_case and word.isascii())
+        found = rules.search(word)
+        if found is None:
+            # A case sensitive rule may still match the token, which decides the form like in `_check_word`.
+            return word, same_match or rules.keeps(token), "none", None
+
+        position, match = found
+        replacement = rules.replacements[position]
+        if same_match:
+            keeps = replacement.keeps(token, match)
+        else:
+            keeps = rules.keeps(token)
+        return self._replace(word, match, replacement), keeps, "rule", rules.rules[position]
+
+    def plural_many(self, words: Iterable[str]) -> list[str]:
+        """Pluralize many words, in input order. Repeated words are only pluralized once."""
+        words = list(words)
+        results = self._inflect_distinct(self._plural_word, words)
+        return [results[word] for word in words]
+
+    def is_plural_many(self, words: Iterable[str]) -> list[bool]:
+        """Check if each of many words is plural, in input order."""
+        words = list(words)
+        results = self._inflect_distinct(self._is_plural_word, words)
+        return [results[word] for word in words]
+
+    def singular_many(self, words: Iterable[str]) -> list[str]:
+        """Singularize many words, in input order. Repeated words are only singularized once."""
+        words = list(words)
+        results = self._inflect_distinct(self._singular_word, words)
+        return [results[word] for word in words]
+
+    def is_singular_many(self, words: Iterable[str]) -> list[bool]:
+        """Check if each of many words is singular, in input order."""
+        words = list(words)
+        results = self._inflect_distinct(self._is_singular_word, words)
+        return [results[word] for word in words]
+
+    def plural_array(self, values: Any) -> Any:
+        """Pluralize every string of a NumPy array or pandas Series, each distinct value once, see `plural_many`.
+
+        Returns an array of the same shape, or a Series with the same index, see `vectorized.inflect_array`.
+        Requires NumPy, which is an optional dependency.
+        """
+        from .vectorized import inflect_array
+
+        return inflect_array(self.plural_many, values)
+
+    def singular_array(self, values: Any) -> Any:
+        """Singularize every string of a NumPy array or pandas Series, see `plural_array`."""
+        from .vectorized import inflect_array
+
+        return inflect_array(self.singular_many, values)
+
+    def pluralize_many(self, words: Iterable[str], counts: Iterable[int | None], inclusive: bool = False) -> list[str]:
+        """Pluralize or singularize many words based on their counts, see `pluralize`.
+
+        Raises:
+            ValueError: When words and counts have different lengths.
+        """
+        pairs = list(zip(words, counts, strict=True))
+        singulars = self._inflect_distinct(self._singular_word, (word for word, count in pairs if count == 1))
+        plurals = self._inflect_distinct(self._plural_word, (word for word, count in pairs if count != 1))
+
+        return [
+            (str(count) + " " if inclusive else "") + (singulars[word] if count == 1 else plurals[word])
+            for word, count in pairs
+        ]
+
+    def _iter_inflect(self, inflect: Callable[[str], T], words: Iterable[str], cache_size: int) -> Iterator[T]:
+        """Lazily run words through `inflect`, remembering recent results in a private LRU cache."""
+        cache: LRUCache[str, T] = LRUCache(cache_size)
+        version = self._rules_version
+        for word in words:
+            if version != self._rules_version:
+                cache.clear()
+                version = self._rules_version
+
+            result = cache.get(word)
+            if result is None:
+                result = inflect(word)
+                cache.put(word, result)
+            yield result
+
+    def iter_plural(self, words: Iterable[str], cache_size: int = DEFAULT_CACHE_SIZE) -> Iterator[str]:
+        """Lazily pluralize a stream of words, e.g. the lines of a file, in constant memory.
+
+        Results for the last `cache_size` distinct words are kept in a cache private to the stream,
+        so repeated words are cheap without evicting the instance's own cache.
+        """
+        return self._iter_inflect(self._plural_word, words, cache_size)
+
+    def iter_singular(self, words: Iterable[str], cache_size: int = DEFAULT_CACHE_SIZE) -> Iterator[str]:
+        """Lazily singularize a stream of words in constant memory, see `iter_plural`."""
+        return self._iter_inflect(self._singular_word, words, cache_size)
+
+    def _rule_tables(self) -> RuleTables:
+        """Copy every rule into a picklable snapshot."""
+        return RuleTables(
+            list(self.pluralRules),
+            list(self.singularRules),
+            dict.fromkeys(self._uncountables, True),
+            dict(self._irregular_plurals.items()),
+            dict(self._irregular_singles.items()),
+        )
+
+    def _set_rule_tables(self, tables: RuleTables) -> None:
+        """Replace every rule with the ones of a snapshot, in place."""
+        self._ensure_mutable()
+        self.pluralRules[:] = tables.plural_rules
+        self.singularRules[:] = tables.singular_rules
+        self.uncountables.clear()
+        self.uncountables.update(tables.uncountables)
+        self.irregularPlurals.clear()
+        self.irregularPlurals.update(tables.irregular_plurals)
+        self.irregularSingles.clear()
+        self.irregularSingles.update(tables.irregular_singles)
+        self._rules_changed()
+
+    @staticmethod
+    def _init_worker(tables: RuleTables) -> None:
+        """Set up the Pluralizer of a process pool worker from the rules of the parent."""
+        global _worker_pluralizer
+        _worker_pluralizer = Pluralizer(cache_size=0, default_rules=False)
+        _worker_pluralizer._set_rule_tables(tables)
+
+    @staticmethod
+    def _plural_chunk(words: list[str]) -> list[str]:
+        assert _worker_pluralizer is not None
+        return _worker_pluralizer.plural_many(words)
+
+    @staticmethod
+    def _singular_chunk(words: list[str]) -> list[str]:
+        assert _worker_pluralizer is not None
+        return _worker_pluralizer.singular_many(words)
+
+    def _map_parallel(
+        self,
+        inflect_many: Callable[[list[str]], list[str]],
+        inflect_chunk: Callable[[list[str]], list[str]],
+        words: Iterable[str],
+        workers: int | None,
+        chunksize: int,
+    ) -> list[str]:
+        """Split words into chunks and inflect them in a pool of worker processes, keeping the input order."""
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be positive, got {chunksize}")
+
+        words = list(words)
+        workers = workers or os.cpu_count() or 1
+        # Starting processes is not worth it for a single chunk.
+        if workers == 1 or len(words) <= chunksize:
+            return inflect_many(words)
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunks = [words[start : start + chunksize] for start in range(0, len(words), chunksize)]
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)), initializer=Pluralizer._init_worker, initargs=(self._rule_tables(),)
+        ) as executor:
+            return [result for results in executor.map(inflect_chunk, chunks) for result in results]
+
+    def plural_parallel(
+        self, words: Iterable[str], workers: int | None = None, chunksize: int = DEFAULT_CHUNK_SIZE
+    ) -> list[str]:
+        """Pluralize many words in a pool of worker processes, in input order.
+
+        The rules, including the ones added to this instance, are sent to each worker once. Words
+        are sent in chunks of `chunksize`, each pluralized like `plural_many`. Use this for large
+        vocabularies on multi-core machines, `workers` defaults to the number of CPUs.
+        """
+        return self._map_parallel(self.plural_many, Pluralizer._plural_chunk, words, workers, chunksize)
+
+    def singular_parallel(
+        self, words: Iterable[str], workers: int | None = None, chunksize: int = DEFAULT_CHUNK_SIZE
+    ) -> list[str]:
+        """Singularize many words in a pool of worker processes, see `plural_parallel`."""
+        return self._map_parallel(self.singular_many, Pluralizer._singular_chunk, words, workers, chunksize)
+
+    async def _amap(
+        self,
+        inflect_many: Callable[[list[str]], list[T]],
+        words: Iterable[str],
+        chunksize: int,
+        executor: "Executor | None",
+    ) -> list[T]:
+        """Inflect short inputs inline, and large ones chunk by chunk in an executor without blocking the loop."""
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be positive, got {chunksize}")
+
+        words = list(words)
+        if len(words) <= chunksize:
+            return inflect_many(words)
+
+        import asyncio
+
+        # Awaiting each chunk yields to the event loop, and cancelling stops before the next chunk.
+        loop = asyncio.get_running_loop()
+        results: list[T] = []
+        for start in range(0, len(words), chunksize):
+            results.extend(await loop.run_in_executor(executor, inflect_many, words[start : start + chunksize]))
+
+        return results
+
+    async def aplural_many(
+        self, words: Iterable[str], chunksize: int = DEFAULT_ASYNC_CHUNK_SIZE, executor: "Executor | None" = None
+    ) -> list[str]:
+        """Pluralize many words from a coroutine, see `plural_many`.
+
+        Up to `chunksize` words are pluralized inline. Larger inputs are pluralized in chunks in
+        `executor`, the loop's default thread pool unless given, so the event loop keeps running.
+        """
+        return await self._amap(self.plural_many, words, chunksize, executor)
+
+    async def asingular_many(
+        self, words: Iterable[str], chunksize: int = DEFAULT_ASYNC_CHUNK_SIZE, executor: "Executor | None" = None
+    ) -> list[str]:
+        """Singularize many words from a coroutine, see `aplural_many`."""
+        return await self._amap(self.singular_many, words, chunksize, executor)
+
+    async def ais_plural_many(
+        self, words: Iterable[str], chunksize: int = DEFAULT_ASYNC_CHUNK_SIZE, executor: "Executor | None" = None
+    ) -> list[bool]:
+        """Check if each of many words is plural from a coroutine, see `aplural_many`."""
+        return await self._amap(self.is_plural_many, words, chunksize, executor)
+
+    async def ais_singular_many(
+        self, words: Iterable[str], chunksize: int = DEFAULT_ASYNC_CHUNK_SIZE, executor: "Executor | None" = None
+    ) -> list[bool]:
+        """Check if each of many words is singular from a coroutine, see `aplural_many`."""
+        return await self._amap(self.is_singular_many, words, chunksize, executor)
+
+    def cache_info(self) -> CacheInfo:
+        """Report hits, misses, maximum and current size of the result cache."""
+        return self._cache.info()
+
+    def cache_clear(self) -> None:
+        """Empty the result cache and reset its statistics."""
+        self._cache.reset()
+
+    def _rules_changed(self) -> None:
+        """Drop everything derived from the rules after one of them was added."""
+        self._cache.clear()
+        self._text_scanners.clear()
+        self._rules_version += 1
+        self._plural_index = None
+        self._singular_index = None
+        self._plural_table = {}
+        self._singular_table = {}
+        if self._stats is not None:
+            self._stats.rules_changed()
+
+    def _ensure_mutable(self) -> None:
+        if self._frozen:
+            raise TypeError("Can not add rules to a frozen Pluralizer")
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the rules are frozen, see `freeze`."""
+        return self._frozen
+
+    def freeze(self, compact: bool = False, automaton: bool = False) -> "Pluralizer":
+        """Compile the rules into immutable structures and forbid adding rules, returning the Pluralizer itself.
+
+        `compact` packs the uncountables and irregular words into compact tables, and `automaton` compiles the
+        rules into suffix automata. Both can also be applied to an already frozen Pluralizer.
+        """
+        if not self._frozen:
+            self._uncountables = frozenset(self.uncountables)
+            self._irregular_plurals = MappingProxyType(dict(self.irregularPlurals))
+            self._irregular_singles = MappingProxyType(dict(self.irregularSingles))
+            self._plural_rules().build()
+            self._singular_rules().build()
+            self._frozen = True
+
+        if compact and not isinstance(self._uncountables, CompactSet):
+            self._compact()
+
+        if automaton:
+            self._plural_index = self._plural_rules().with_automaton()
+            self._singular_index = self._singular_rules().with_automaton()
+
+        return self
+
+    def _compact(self) -> None:
+        """Replace the uncountables and irregular words of a frozen Pluralizer with compact tables."""
+        pairs = [*self._irregular_plurals.items(), *self._irregular_singles.items()]
+        words = CompactWords([*self._uncountables, *(word for pair in pairs for word in pair)])
+        self._uncountables = CompactSet(words, self._uncountables)
+        self._irregular_plurals = CompactMap(words, self._irregular_plurals)
+        self._irregular_singles = CompactMap(words, self._irregular_singles)
+        words.release()
+
+        self.uncountables = {}
+        self.irregularPlurals = {}
+        self.irregularSingles = {}
+
+    def precompute(self, vocabulary: Iterable[str]) -> None:
+        """Inflect a known vocabulary once, so that `plural` and `singular` look its words up instead of the rules."""
+        plural_table = dict(self._plural_table)
+        singular_table = dict(self._singular_table)
+        for word in vocabulary:
+            plural = plural_table[word] = self._plural_word(word)
+            singular_table[word] = self._singular_word(word)
+            singular_table[plural] = self._singular_word(plural)
+
+        self._plural_table = plural_table
+        self._singular_table = singular_table
+
+    def _rules_fingerprint(self) -> str:
+        """Return a digest of every rule, which changes whenever the rules do."""
+        import hashlib
+
+        rules = (
+            [(pattern.pattern, pattern.flags, replacement) for pattern, replacement in self._plural_rules().rules],
+            [(pattern.pattern, pattern.flags, replacement) for pattern, replacement in self._singular_rules().rules],
+            sorted(self._uncountables),
+            sorted(self._irregular_plurals.items()),
+            sorted(self._irregular_singles.items()),
+        )
+        return hashlib.sha256(repr(rules).encode()).hexdigest()
+
+    def save_precomputed(self, path: str | os.PathLike[str]) -> None:
+        """Write the lookup tables of `precompute` to a versioned file, along with a fingerprint of the rules.
+
+        The file is a pickle, only load it from trusted sources.
+        """
+        from .snapshot import write_snapshot
+
+        write_snapshot(path, _Precomputed(self._rules_fingerprint(), self._plural_table, self._singular_table))
+
+    def load_precomputed(self, path: str | os.PathLike[str]) -> None:
+        """Replace the lookup tables of `precompute` with the ones saved by `save_precomputed`.
+
+        Raises ValueError if the file is not a snapshot of this version of pluralizer, or if the tables were
+        computed with different rules than the current ones.
+        """
+        from .snapshot import read_snapshot
+
+        precomputed = read_snapshot(path)
+        if not isinstance(precomputed, _Precomputed):
+            raise ValueError(f"{os.fspath(path)!r} does not contain precomputed words")
+        if precomputed.fingerprint != self._rules_fingerprint():
+            raise ValueError(f"{os.fspath(path)!r} was precomputed with different rules")
+
+        self._plural_table = precomputed.plural_table
+        self._singular_table = precomputed.singular_table
+
+    def dump(self, path: str | os.PathLike[str]) -> None:
+        """Write every rule, and their fully built suffix indexes, to a versioned snapshot file.
+
+        Load it with `Pluralizer.load`, e.g. in each worker of a service, instead of adding the same rules
+        again. The file is a pickle, only load snapshots from trusted sources.
+        """
+        from .snapshot import write_snapshot
+
+        plural_index = self._plural_rules()
+        singular_index = self._singular_rules()
+        plural_index.build()
+        singular_index.build()
+        write_snapshot(path, _Snapshot(self._rule_tables(), plural_index, singular_index, self._frozen))
+
+    @classmethod
+    def load(
+        cls, path: str | os.PathLike[str], cache_size: int = DEFAULT_CACHE_SIZE, memory_map: bool = False
+    ) -> "Pluralizer":
+        """Create a Pluralizer from a snapshot written by `dump`.
+
+        The rules are used as they were saved, without adding them one by one or rebuilding the suffix
+        indexes, and the default rules are not loaded. The Pluralizer is frozen if it was frozen when
+        dumped. With `memory_map` the file is read through a memory mapping rather than copied first.
+        Raises ValueError if the file is not a snapshot of this version of pluralizer.
+        """
+        from .snapshot import read_snapshot
+
+        snapshot = read_snapshot(path, memory_map)
+        if not isinstance(snapshot, _Snapshot):
+            raise ValueError(f"{os.fspath(path)!r} does not contain Pluralizer rules")
+
+        pluralizer = cls(cache_size, default_rules=False)
+        pluralizer._load_rules(snapshot.tables, snapshot.plural_index, snapshot.singular_index)
+        return pluralizer.freeze() if snapshot.frozen else pluralizer
+
+    def dead_rules(self) -> DeadRules:
+        """Find the rules which are never applied, or only to words like `"tuna\\n"`, see `DeadRule`."""
+        uncountables = self._uncountables
+        return DeadRules(
+            find_dead_rules(self._plural_rules().rules, uncountables),
+            find_dead_rules(self._singular_rules().rules, uncountables),
+        )
+
+    def prune_rules(self) -> DeadRules:
+        """Remove the "duplicate" and "overridden" rules found by `dead_rules`, returning them."""
+        self._ensure_mutable()
+        dead = self.dead_rules()
+        pruned = DeadRules(*(tuple(rule for rule in found if rule.reason != "uncountable") for found in dead))
+        if not (pruned.plural_rules or pruned.singular_rules):
+            return pruned
+
+        for rules, found in [(self.pluralRules, pruned.plural_rules), (self.singularRules, pruned.singular_rules)]:
+            for rule in reversed(found):
+                del rules[rule.position]
+        self._rules_changed()
+        return pruned
 
     def add_plural_rule(self, rule: str | re.Pattern[str], replacement: str) -> None:
         """Add a pluralization rule to the collection."""
+        self._ensure_mutable()
         self.pluralRules.append((self._sanitize_rule(rule), replacement))
+        self._rules_changed()
 
     def add_singular_rule(self, rule: str | re.Pattern[str], replacement: str) -> None:
         """Add a singularization rule to the collection."""
+        self._ensure_mutable()
         self.singularRules.append((self._sanitize_rule(rule), replacement))
+        self._rules_changed()
 
     def add_uncountable_rule(self, word: str | re.Pattern[str]) -> None:
         """Add an uncountable word rule."""
+        self._ensure_mutable()
         if isinstance(word, str):
             self.uncountables[word.lower()] = True
+            self._rules_changed()
             return
 
         # Set singular and plural references for the word.
@@ -207,8 +1024,44 @@ class Pluralizer:
 
     def add_irregular_rule(self, single: str, plural: str) -> None:
         """Add an irregular word definition."""
+        self._ensure_mutable()
         plural = plural.lower()
         single = single.lower()
 
         self.irregularSingles[single] = plural
         self.irregularPlurals[plural] = single
+        self._rules_changed()
+
+
+def default_pluralizer() -> Pluralizer:
+    """Return the shared, frozen Pluralizer with the default rules, created on first use."""
+    global _default_pluralizer
+    pluralizer = _default_pluralizer
+    if pluralizer is None:
+        pluralizer = _default_pluralizer = Pluralizer().freeze()
+    return pluralizer
+
+
+def pluralize(word: str, count: int | None = None, inclusive: bool = False) -> str:
+    """Pluralize or singularize a word based on the passed in count, using the default rules."""
+    return default_pluralizer().pluralize(word, count, inclusive)
+
+
+def plural(word: str) -> str:
+    """Pluralize a word using the default rules."""
+    return default_pluralizer().plural(word)
+
+
+def singular(word: str) -> str:
+    """Singularize a word using the default rules."""
+    return default_pluralizer().singular(word)
+
+
+def is_plural(word: str) -> bool:
+    """Check if a word is plural using the default rules."""
+    return default_pluralizer().is_plural(word)
+
+
+def is_singular(word: str) -> bool:
+    """Check if a word is singular using the default rules."""
+    return default_pluralizer().is_singular(word)
@@ -0,0 +1,92 @@
+import re
+from functools import lru_cache
+
+# `$0` to `$99` refer to the groups of the rule's match.
+_GROUP_REFERENCE = re.compile(r"\$(\d{1,2})")
+
+
+class Replacement:
+    """A rule replacement such as "$1ies", parsed once into literal and group reference segments.
+
+    Expanding it against a match joins the segments, with unmatched groups replaced by an
+    empty string. Replacements without group references expand to the literal string.
+    """
+
+    __slots__ = ("source", "segments", "literal", "lowered", "lowered_literal")
+
+    def __init__(self, source: str):
+        super().__init__()
+
+        segments: list[str | int] = []
+        position = 0
+        for reference in _GROUP_REFERENCE.finditer(source):
+            if reference.start() > position:
+                segments.append(source[position : reference.start()])
+            segments.append(int(reference.group(1)))
+            position = reference.end()
+        if position < len(source):
+            segments.append(source[position:])
+
+        self.source = source
+        self.segments: tuple[str | int, ...] = tuple(segments)
+        self.literal: str | None = None if any(isinstance(segment, int) for segment in segments) else source
+        # The segments lower cased one by one, which lower cases the whole replacement when its literal
+        # segments are ASCII, see `keeps`.
+        self.lowered: tuple[str | int, ...] | None = (
+            tuple(segment.lower() if isinstance(segment, str) else segment for segment in segments)
+            if all(isinstance(segment, int) or segment.isascii() for segment in segments)
+            else None
+        )
+        self.lowered_literal: str | None = None if self.literal is None else self.literal.lower()
+
+    def expand(self, match: re.Match[str]) -> str:
+        """Build the replacement text for a match."""
+        if self.literal is not None:
+            return self.literal
+
+        group = match.group
+        return "".join([segment if isinstance(segment, str) else (group(segment) or "") for segment in self.segments])
+
+    def keeps(self, text: str, match: re.Match[str]) -> bool:
+        """Tell whether replacing a match leaves a lower case text unchanged.
+
+        Lower case words get a lower cased replacement, so this compares the lowered segments with the text
+        matched, in place, without building the replacement.
+        """
+        start, end = match.span()
+        if self.lowered_literal is not None:
+            return self.keeps_span(text, start, end)
+
+        segments = self.lowered
+        if segments is None:
+            return self.expand(match).lower() == text[start:end]
+
+        position = start
+        for segment in segments:
+            if isinstance(segment, str):
+                if not text.startswith(segment, position):
+                    return False
+                position += len(segment)
+                continue
+
+            group_start, group_end = match.span(segment)
+            if group_start < 0:
+                continue
+            # A group read back where it was matched, e.g. the `$1` of "$1es", is equal to itself.
+            if group_start != position and not text.startswith(text[group_start:group_end], position):
+                return False
+            position += group_end - group_start
+
+        return position == end
+
+    def keeps_span(self, text: str, start: int, end: int) -> bool:
+        """Like `keeps`, for a replacement without group references, given the span of the match."""
+        literal = self.lowered_literal
+        assert literal is not None, "the replacement has group references"
+        return end - start == len(literal) and text.startswith(literal, start)
+
+
+@lru_cache(maxsize=None)
+def compile_replacement(source: str) -> Replacement:
+    """Parse a replacement string, sharing the result between rules with the same replacement."""
+    return Replacement(source)
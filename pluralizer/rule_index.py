@@ -0,0 +1,303 @@
+import re
+from typing import TYPE_CHECKING, Any, Iterable, Sequence, Tuple
+
+from .replacement import Replacement, compile_replacement
+
+if TYPE_CHECKING:
+    import sre_parse
+
+    from .automaton import SuffixAutomaton
+else:
+    try:
+        from re import _parser as sre_parse
+    except ImportError:  # pragma: no cover - Python 3.10
+        import sre_parse
+
+Rule = Tuple[re.Pattern[str], str]
+
+# How many trailing characters of a word are used to look up candidate rules.
+INDEX_DEPTH = 3
+# Character classes with more members than this are treated like a wildcard.
+MAX_CLASS_SIZE = 8
+
+# A suffix path is a reversed, lower cased string of characters that a match must end with,
+# and whether the characters before it are still known.
+_Path = Tuple[str, bool]
+
+_WILDCARD: frozenset[_Path] = frozenset({("", False)})
+_EMPTY: frozenset[_Path] = frozenset({("", True)})
+
+_END_ANCHORS = (sre_parse.AT_END, sre_parse.AT_END_STRING)
+_REPEATS = tuple(
+    getattr(sre_parse, name) for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT") if hasattr(sre_parse, name)
+)
+
+
+def _class_members(items: list[tuple[Any, Any]]) -> set[str] | None:
+    """Expand a small, non negated, ASCII character class into its members."""
+    members: set[str] = set()
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            members.add(chr(av))
+        elif op is sre_parse.RANGE and av[1] - av[0] < MAX_CLASS_SIZE:
+            members.update(chr(code) for code in range(av[0], av[1] + 1))
+        else:
+            return None
+
+    if len(members) > MAX_CLASS_SIZE or not all(member.isascii() for member in members):
+        return None
+
+    return {member.lower() for member in members}
+
+
+def _item_paths(op: Any, av: Any, depth: int) -> Iterable[_Path]:
+    """Return the suffix paths of a single parsed regex item."""
+    if op is sre_parse.LITERAL:
+        char = chr(av)
+        return {(char.lower(), True)} if char.isascii() else _WILDCARD
+
+    if op is sre_parse.IN:
+        members = _class_members(av)
+        return _WILDCARD if members is None else {(member, True) for member in members}
+
+    if op is sre_parse.SUBPATTERN:
+        return _sequence_paths(av[-1], depth)
+
+    if op is sre_parse.BRANCH:
+        return {path for branch in av[1] for path in _sequence_paths(branch, depth)}
+
+    if op in _REPEATS:
+        low, high, items = av
+        paths = _sequence_paths(items, depth)
+        if (low, high) != (1, 1):
+            # Only the last repetition is known, except when there is at most one.
+            paths = paths if high == 1 else {(path, False) for path, _ in paths}
+        if low == 0:
+            paths = {*paths, *_EMPTY}
+        return paths
+
+    # Anchors, lookarounds, atomic groups, negated literals, categories, back references, ...
+    return _WILDCARD
+
+
+def _sequence_paths(items: Sequence[tuple[Any, Any]], depth: int) -> set[_Path]:
+    """Return the suffix paths of a sequence of parsed regex items, reading it from the end."""
+    paths: set[_Path] = set(_EMPTY)
+    for op, av in reversed(items):
+        if not any(is_open for _, is_open in paths):
+            break
+
+        item_paths = _item_paths(op, av, depth)
+        extended: set[_Path] = set()
+        for path, is_open in paths:
+            if not is_open:
+                extended.add((path, False))
+                continue
+
+            for suffix, suffix_open in item_paths:
+                combined = path + suffix
+                extended.add((combined[:depth], suffix_open and len(combined) < depth))
+        paths = extended
+
+    return paths
+
+
+def rule_suffixes(pattern: re.Pattern[str], depth: int = INDEX_DEPTH) -> set[str] | None:
+    """Find the reversed, lower cased suffixes that every match of an end anchored pattern finishes with.
+
+    An empty suffix means the pattern can finish with any character. Returns None when the
+    pattern can not be analysed, e.g. it is not anchored to the end of the word.
+    """
+    if pattern.flags & re.MULTILINE:
+        return None
+
+    try:
+        items: list[tuple[Any, Any]] = sre_parse.parse(pattern.pattern, pattern.flags).data
+    except Exception:  # pragma: no cover - compiled patterns always parse
+        return None
+
+    if not items:
+        return None
+
+    op, av = items[-1]
+    if op is not sre_parse.AT or av not in _END_ANCHORS:
+        return None
+
+    return {path for path, _ in _sequence_paths(items[:-1], depth)}
+
+
+def shadowed_rules(rules: Sequence[Rule]) -> dict[int, int]:
+    """Find the rules shadowed by a newer rule with the same pattern, mapping their positions to the newer rule's.
+
+    Rules are tried newest first, and a newer rule with the same pattern and flags matches every word that an older
+    one does, so the older one is never applied.
+    """
+    newest: dict[tuple[str, int], int] = {}
+    shadowed: dict[int, int] = {}
+    for position in range(len(rules) - 1, -1, -1):
+        pattern = rules[position][0]
+        newer = newest.setdefault((pattern.pattern, pattern.flags), position)
+        if newer != position:
+            shadowed[position] = newer
+    return shadowed
+
+
+class _Node:
+    __slots__ = ("children", "rules", "candidates", "subtree")
+
+    def __init__(self):
+        super().__init__()
+
+        self.children: dict[str, _Node] = {}
+        self.rules: set[int] = set()
+        self.candidates: tuple[int, ...] = ()
+        self.subtree: tuple[int, ...] = ()
+
+
+class RuleIndex:
+    """A suffix trie over a list of rules, keyed on the last few characters of a word.
+
+    Rules are applied newest first, and most of them can only match words ending in a few
+    known letters. Each rule is analysed once and stored at the trie nodes of the reversed
+    suffixes it can end with, so looking up a word only returns the rules that could match
+    it, still ordered by priority. Rules which can't be analysed are stored at the root and
+    are returned for every word. Rules shadowed by a newer rule with the same pattern, see
+    `shadowed_rules`, are left out.
+
+    The index is an immutable snapshot of the rules, which can be shared freely. The trie is
+    built on the first lookup, or up front with `build`. `with_automaton` returns a copy which
+    searches words with a SuffixAutomaton instead.
+    """
+
+    __slots__ = ("rules", "replacements", "ignores_case", "shadowed", "depth", "_root", "_automaton")
+
+    def __init__(self, rules: Iterable[Rule] = (), depth: int = INDEX_DEPTH):
+        super().__init__()
+
+        self.rules: tuple[Rule, ...] = tuple(rules)
+        self.replacements: tuple[Replacement, ...] = tuple(compile_replacement(rule[1]) for rule in self.rules)
+        # Whether every rule ignores case, so matches a word and its lower cased copy alike when they are ASCII.
+        # Rules which may turn it off in a group, e.g. `(?-i:...)`, are assumed not to.
+        self.ignores_case = all(rule[0].flags & re.IGNORECASE and "(?-" not in rule[0].pattern for rule in self.rules)
+        self.shadowed = frozenset(shadowed_rules(self.rules))
+        self.depth = depth
+        self._root: _Node | None = None
+        self._automaton: "SuffixAutomaton | None" = None
+
+    def build(self) -> None:
+        """Build the trie now rather than on the first lookup."""
+        if self._root is None:
+            _ = self._build()
+
+    def _build(self) -> _Node:
+        root = _Node()
+        for position, (pattern, _) in enumerate(self.rules):
+            if position in self.shadowed:
+                continue
+            suffixes = rule_suffixes(pattern, self.depth)
+            for suffix in suffixes or ("",):
+                node = root
+                for char in suffix:
+                    child = node.children.get(char)
+                    if child is None:
+                        child = node.children[char] = node.children[char.upper()] = _Node()
+                    node = child
+                node.rules.add(position)
+
+        _ = self._prioritise(root, set())
+        self._root = root
+        return root
+
+    def _prioritise(self, node: _Node, inherited: set[int]) -> set[int]:
+        """Fill the candidate tuples of every node, returning the rules found below it."""
+        inherited = inherited | node.rules
+        below = set(inherited)
+        for child in {id(child): child for child in node.children.values()}.values():
+            below |= self._prioritise(child, inherited)
+
+        node.candidates = tuple(sorted(inherited, reverse=True))
+        node.subtree = tuple(sorted(below, reverse=True))
+        return below
+
+    def candidates(self, word: str) -> tuple[int, ...]:
+        """Return the positions of the rules which could match the word, highest priority first."""
+        node = self._root or self._build()
+        # `$` also matches before a trailing new line.
+        if word.endswith("\n"):
+            return node.subtree
+
+        index = len(word)
+        stop = max(index - self.depth, 0)
+        while index > stop:
+            index -= 1
+            char = word[index]
+            # Non ASCII characters may match ASCII letters case insensitively, e.g. "ſ" and "s".
+            if char > "\x7f":
+                return node.subtree
+
+            child = node.children.get(char)
+            if child is None:
+                break
+            node = child
+
+        return node.candidates
+
+    def with_automaton(self) -> "RuleIndex":
+        """Return a copy of the index searching words with a SuffixAutomaton of its rules.
+
+        The copy shares the rules and the trie, which is still used by `candidates`. The index is returned
+        as it is when its rules compile into too large an automaton.
+        """
+        if self._automaton is not None:
+            return self
+
+        from .automaton import compile_automaton
+
+        automaton = compile_automaton([rule[0] for rule in self.rules], self.shadowed)
+        if automaton is None:
+            return self
+
+        index = RuleIndex(self.rules, self.depth)
+        index._root = self._root or self._build()
+        index._automaton = automaton
+        return index
+
+    def search(self, word: str) -> tuple[int, re.Match[str]] | None:
+        """Find the highest priority rule matching the word, returning its position and the match."""
+        automaton = self._automaton
+        # The automaton reads ASCII characters, and doesn't know that `$` matches before a trailing new line.
+        if automaton is not None and word.isascii() and not word.endswith("\n"):
+            return automaton.search(word)
+
+        rules = self.rules
+        for position in self.candidates(word):
+            match = rules[position][0].search(word)
+            if match:
+                return position, match
+
+        return None
+
+    def keeps(self, word: str) -> bool:
+        """Tell whether the highest priority rule matching a lower case word leaves it unchanged.
+
+        Words without any matching rule are kept too. With an automaton, rules replacing their match with a
+        literal string are checked without matching their regex.
+        """
+        automaton = self._automaton
+        if automaton is not None and word.isascii() and not word.endswith("\n"):
+            located = automaton.locate(word)
+            if located is None:
+                return True
+            position, start, match = located
+            replacement = self.replacements[position]
+            if match is None:
+                if replacement.literal is not None:
+                    return replacement.keeps_span(word, start, len(word))
+                match = automaton.match(position, word, start)
+            return replacement.keeps(word, match)
+
+        found = self.search(word)
+        if found is None:
+            return True
+        position, match = found
+        return self.replacements[position].keeps(word, match)
@@ -0,0 +1,66 @@
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+
+# A snapshot file starts with this header, followed by a pickle of the payload.
+MAGIC = b"PLURALIZER"
+# Incremented whenever the payload, or any class pickled into it, changes shape.
+SNAPSHOT_VERSION = 3
+
+_HEADER = struct.Struct(f"<{len(MAGIC)}sH")
+
+
+def write_snapshot(path: str | os.PathLike[str], payload: object) -> None:
+    """Write a payload to a versioned snapshot file.
+
+    The file is written next to its destination and moved in place, so processes loading it
+    concurrently never read a partially written snapshot.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".pluralizer-", suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            _ = file.write(_HEADER.pack(MAGIC, SNAPSHOT_VERSION))
+            pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+        # mkstemp creates the file readable by its owner only, give it the mode `open` would.
+        os.chmod(temporary, 0o666 & ~_umask())
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def _umask() -> int:
+    """Return the umask of the process, which can only be read by setting it."""
+    umask = os.umask(0o022)
+    _ = os.umask(umask)
+    return umask
+
+
+def read_snapshot(path: str | os.PathLike[str], memory_map: bool = False) -> object:
+    """Read the payload of a snapshot file, raising ValueError if it is not a snapshot of this version.
+
+    With `memory_map` the payload is unpickled straight from a read-only mapping of the file,
+    rather than from a copy of its content.
+    """
+    with open(path, "rb") as file:
+        if not memory_map:
+            return _unpack(file.read(), path)
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as data:
+            return _unpack(data, path)
+
+
+def _unpack(data: bytes | memoryview, path: str | os.PathLike[str]) -> object:
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{os.fspath(path)!r} is not a pluralizer snapshot")
+
+    magic, version = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{os.fspath(path)!r} is not a pluralizer snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"{os.fspath(path)!r} has snapshot version {version}, expected {SNAPSHOT_VERSION}")
+
+    return pickle.loads(data[_HEADER.size :])
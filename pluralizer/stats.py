@@ -0,0 +1,81 @@
+from typing import Iterable, NamedTuple
+
+from .rule_index import Rule
+
+# The lookups which can settle a word before any rule is tried.
+SHORTCUTS = ("keep", "irregular", "uncountable")
+# The stages of inflecting a word, which are timed separately.
+STAGES = ("lookup", "rules", "replace")
+
+
+class RuleStat(NamedTuple):
+    """How often a rule was tried against a word, and how often it matched."""
+
+    pattern: str
+    replacement: str
+    tried: int
+    matched: int
+
+
+class PluralizerStats(NamedTuple):
+    """A snapshot of the counters collected by `Pluralizer.enable_stats`.
+
+    The rules are listed in the order they were added, like `Pluralizer.pluralRules`. `words` counts the words
+    inflected or checked, `shortcuts` how many of them were settled by each of SHORTCUTS, and `seconds` the time
+    spent in each of STAGES.
+    """
+
+    words: int
+    plural_rules: tuple[RuleStat, ...]
+    singular_rules: tuple[RuleStat, ...]
+    shortcuts: dict[str, int]
+    seconds: dict[str, float]
+
+
+class RuleCounters:
+    """How often each rule of one kind was tried and matched, keyed by its position, since duplicate rules are equal."""
+
+    __slots__ = ("tried", "matched")
+
+    def __init__(self):
+        super().__init__()
+
+        self.tried: dict[int, int] = {}
+        self.matched: dict[int, int] = {}
+
+    def snapshot(self, rules: Iterable[Rule]) -> tuple[RuleStat, ...]:
+        tried = self.tried
+        matched = self.matched
+        return tuple(
+            RuleStat(pattern.pattern, replacement, tried.get(position, 0), matched.get(position, 0))
+            for position, (pattern, replacement) in enumerate(rules)
+        )
+
+
+class StatsCollector:
+    """The counters of an instrumented Pluralizer, updated without locking."""
+
+    __slots__ = ("words", "plural", "singular", "shortcuts", "seconds")
+
+    def __init__(self):
+        super().__init__()
+
+        self.words = 0
+        self.plural = RuleCounters()
+        self.singular = RuleCounters()
+        self.shortcuts: dict[str, int] = dict.fromkeys(SHORTCUTS, 0)
+        self.seconds: dict[str, float] = dict.fromkeys(STAGES, 0.0)
+
+    def snapshot(self, plural_rules: Iterable[Rule], singular_rules: Iterable[Rule]) -> PluralizerStats:
+        return PluralizerStats(
+            self.words,
+            self.plural.snapshot(plural_rules),
+            self.singular.snapshot(singular_rules),
+            dict(self.shortcuts),
+            dict(self.seconds),
+        )
+
+    def rules_changed(self) -> None:
+        """Reset the rule counters, whose positions no longer match the rules."""
+        self.plural = RuleCounters()
+        self.singular = RuleCounters()
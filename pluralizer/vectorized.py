@@ -0,0 +1,88 @@
+import importlib
+import sys
+from typing import Any, Callable
+
+# NumPy and pandas are optional. They are imported on first use, and typed loosely, so that the package stays
+# free of dependencies and type checks without them.
+
+
+def _import_numpy() -> Any:
+    try:
+        return importlib.import_module("numpy")
+    except ImportError as error:
+        raise ImportError(
+            "Inflecting arrays requires NumPy, install it with `pip install pluralizer[numpy]`"
+        ) from error
+
+
+def _pandas_series(values: object) -> Any:
+    """Return pandas.Series if the values are a Series, without importing pandas when it isn't loaded."""
+    pandas = sys.modules.get("pandas")
+    if pandas is not None and isinstance(values, pandas.Series):
+        return pandas.Series
+    return None
+
+
+def inflect_array(inflect_many: Callable[[list[str]], list[str]], values: Any) -> Any:
+    """Inflect every string of a NumPy array or pandas Series, inflecting each distinct value once.
+
+    The distinct values are found by pandas.factorize or numpy.unique, inflected by `inflect_many`, and the
+    results are broadcast back with an array lookup. A Series keeps its index, name and dtype, and its missing
+    values. An array keeps its shape, and its dtype when it holds Python objects, with the values other than strings,
+    such as None, kept as they are.
+    """
+    numpy = _import_numpy()
+
+    series = _pandas_series(values)
+    if series is not None:
+        pandas = sys.modules["pandas"]
+        codes, distinct = pandas.factorize(values)
+        inflected = numpy.empty(len(distinct), dtype=object)
+        inflected[:] = inflect_many(list(distinct))
+        # Missing values have the code -1, and are kept as they are.
+        results = values.to_numpy(dtype=object, copy=True)
+        present = codes >= 0
+        results[present] = inflected.take(codes[present])
+        # Inflected values may not be categories of a categorical Series.
+        dtype = None if isinstance(values.dtype, pandas.CategoricalDtype) else values.dtype
+        return series(results, index=values.index, name=values.name, dtype=dtype)
+
+    array = numpy.asarray(values)
+    if array.dtype.kind not in "UO":
+        raise TypeError(f"Expected an array of strings, got dtype {array.dtype}")
+    if array.size == 0:
+        return array.copy()
+
+    flat = array.ravel()
+    if array.dtype.kind == "U":
+        distinct, inverse = numpy.unique(flat, return_inverse=True)
+        inflected = numpy.array(inflect_many(distinct.tolist()), dtype=str)
+        return inflected.take(inverse.ravel()).reshape(array.shape)
+
+    # Missing values, e.g. None or NaN, can't be sorted with strings. They are kept as they are, like in a Series.
+    present = numpy.array([isinstance(value, str) for value in flat], dtype=bool)
+    results = flat.copy()
+    if present.any():
+        distinct, inverse = numpy.unique(flat[present], return_inverse=True)
+        inflected = numpy.empty(len(distinct), dtype=object)
+        inflected[:] = inflect_many(distinct.tolist())
+        results[present] = inflected.take(inverse.ravel())
+    return results.reshape(array.shape)
+
+
+def format_counts(one: str, other: str, counts: Any, inclusive: bool) -> Any:
+    """Pick `one` for the counts equal to 1 and `other` for the rest, prefixing them with the count if inclusive.
+
+    Counts are compared and converted to strings by NumPy, which gives the same text as `str` for integers,
+    floats and Python objects. A Series keeps its index and name, an array its shape.
+    """
+    numpy = _import_numpy()
+
+    series = _pandas_series(counts)
+    array = numpy.asarray(counts)
+    results = numpy.where(array == 1, one, other).astype(object)
+    if inclusive:
+        results = array.astype(str).astype(object) + results
+    if series is not None:
+        return series(results, index=counts.index, name=counts.name)
+    return results
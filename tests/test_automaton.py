@@ -0,0 +1,193 @@
+import itertools
+import random
+import re
+import sys
+import unittest
+from typing import Sequence
+from unittest import mock
+
+from pluralizer import Pluralizer
+from pluralizer.automaton import SuffixAutomaton, compile_automaton, whole_words
+from pluralizer.rule_index import Rule, RuleIndex
+
+from .test_pluralize import BASIC_TESTS, PLURAL_TESTS, SINGULAR_TESTS
+from .test_rule_index import corpus
+
+Found = tuple[int, tuple[int, int], tuple[str | None, ...]] | None
+
+
+def found(index: RuleIndex | SuffixAutomaton, word: str) -> Found:
+    result = index.search(word)
+    if result is None:
+        return None
+    position, match = result
+    return position, match.span(), match.groups()
+
+
+def linear_search(rules: Sequence[Rule], word: str) -> Found:
+    for position in range(len(rules) - 1, -1, -1):
+        match = rules[position][0].search(word)
+        if match:
+            return position, match.span(), match.groups()
+    return None
+
+
+def compile_rules(patterns: Sequence[str]) -> list[Rule]:
+    return [(re.compile(pattern), "") for pattern in patterns]
+
+
+def compile_automaton_of(rules: Sequence[Rule]) -> SuffixAutomaton:
+    return SuffixAutomaton([rule[0] for rule in rules])
+
+
+def random_pattern(rng: random.Random, depth: int = 0) -> str:
+    """Build a random pattern over a few letters, with classes, groups, branches and repeats."""
+    choice = rng.randrange(8 if depth < 2 else 3)
+    if choice == 0:
+        return rng.choice("abs")
+    if choice == 1:
+        return rng.choice(["[ab]", "[^a]", "."])
+    if choice == 2:
+        return "".join(random_pattern(rng, depth + 1) for _ in range(rng.randint(1, 3)))
+    if choice == 3:
+        return f"({random_pattern(rng, depth + 1)}|{random_pattern(rng, depth + 1)})"
+    if choice == 4:
+        return f"(?:{random_pattern(rng, depth + 1)}){rng.choice(['?', '*', '+', '{2}', '{1,3}', '??', '*?'])}"
+    if choice == 5:
+        return f"(?:{random_pattern(rng, depth + 1)})?s"
+    if choice == 6:
+        return "b" + random_pattern(rng, depth + 1)
+    return random_pattern(rng, depth + 1) + "a"
+
+
+class TestAutomaton(unittest.TestCase):
+    def test_default_rules(self):
+        # Differential test of the automaton against the suffix index, over the words of tests/test_pluralize.py.
+        pluralizer = Pluralizer()
+        words = corpus()
+        for rules in [pluralizer.pluralRules, pluralizer.singularRules]:
+            index = RuleIndex(rules)
+            automaton = index.with_automaton()
+            self.assertIsNot(automaton, index)
+            for word in words:
+                self.assertEqual(found(automaton, word), found(index, word), repr(word))
+                self.assertEqual(automaton.keeps(word.lower()), index.keeps(word.lower()), repr(word))
+
+    def test_frozen_pluralizer(self):
+        pluralizer = Pluralizer(cache_size=0).freeze(automaton=True)
+        self.assertIs(pluralizer.freeze(automaton=True), pluralizer)
+        reference = Pluralizer(cache_size=0)
+        for test in [*BASIC_TESTS, *SINGULAR_TESTS, *PLURAL_TESTS]:
+            for word in [shape for form in test for shape in (form, form.upper(), form.title())]:
+                self.assertEqual(pluralizer.plural(word), reference.plural(word), word)
+                self.assertEqual(pluralizer.singular(word), reference.singular(word), word)
+                self.assertEqual(pluralizer.is_plural(word), reference.is_plural(word), word)
+                self.assertEqual(pluralizer.is_singular(word), reference.is_singular(word), word)
+
+    def test_fallback_rules(self):
+        patterns = [
+            r"(?i)s$",
+            r"(?i)\bfoxes$",
+            r"(?i)(?<!o)xes$",
+            r"(?m)ies$",
+            r"ies",
+            r"(?i)(?-i:X)es$",
+            r"(?i)(?=a)as$",
+            r"(?i)(ab)\1s$",
+            r"(?i)b{20}s$",
+            r"(?i)b{2,20}s$",
+        ]
+        approximated = {1, 2, 6}
+        if sys.version_info >= (3, 11):
+            patterns += [r"(?i)a++s$", r"(?i)(?>ab|a)bs$"]
+            approximated |= {10, 11}
+        rules = compile_rules(patterns)
+        automaton = compile_automaton_of(rules)
+        self.assertEqual(automaton.fallbacks, tuple(range(len(rules) - 1, 0, -1)))
+        self.assertEqual(automaton.approximated, approximated)
+        words = ["foxes", "boxfoxes", "a foxes", "axes", "boxes", "cities", "Xes", "aaas", "abbs", "ababs", "bbbs"]
+        for word in [*words, "s", "es", "", "tree"]:
+            self.assertEqual(found(automaton, word), linear_search(rules, word), word)
+
+    def test_anchored_rules(self):
+        rules = compile_rules([r"(?i)s$", r"(?i)^thou$", r"\Athee\Z", r"(?i)^(?:ab)+s?$"])
+        automaton = compile_automaton_of(rules)
+        self.assertEqual(automaton.fallbacks, ())
+        for word in ["thou", "Thou", "sthou", "thee", "Thee", "ababs", "abab", "xabs", "s", ""]:
+            self.assertEqual(found(automaton, word), linear_search(rules, word), word)
+
+    def test_case_sensitive_rules(self):
+        rules = compile_rules([r"s$", r"(?i)ies$", r"IES$", r"(?a)\ws$", r"[\d]x$"])
+        automaton = compile_automaton_of(rules)
+        for word in ["cities", "CITIES", "Cities", "cats", "CATS", "1x", "ax", "_s"]:
+            self.assertEqual(found(automaton, word), linear_search(rules, word), word)
+
+    def test_random_rules(self):
+        rng = random.Random(20)
+        words = ["".join(chars) for length in range(7) for chars in itertools.product("abs", repeat=length)]
+        for _ in range(100):
+            patterns = [random_pattern(rng) + "$" for _ in range(rng.randint(1, 5))]
+            rules = compile_rules(["(?i)" + pattern if rng.random() < 0.5 else pattern for pattern in patterns])
+            automaton = compile_automaton_of(rules)
+            self.assertEqual(automaton.fallbacks, (), patterns)
+            for word in words:
+                self.assertEqual(found(automaton, word), linear_search(rules, word), (patterns, word))
+
+    def test_too_many_states(self):
+        rules = compile_rules([r"(?i)(x|ch|ss|sh)es$"])
+        with mock.patch("pluralizer.automaton.MAX_STATES", 5):
+            self.assertIsNone(compile_automaton([rule[0] for rule in rules]))
+            index = RuleIndex(rules)
+            self.assertIs(index.with_automaton(), index)
+        # A small rule can still have an exponential number of deterministic states.
+        rules = compile_rules([r"^[ab]{6}a[ab]*$"])
+        with mock.patch("pluralizer.automaton.MAX_STATES", 20):
+            self.assertIsNone(compile_automaton([rule[0] for rule in rules]))
+
+    def test_skipped_rules(self):
+        rules = compile_rules([r"(?i)s$", r"(?i)\bfoxes$", r"(?i)ies$", r"(?i)s$", r"(?i)\bfoxes$"])
+        index = RuleIndex(rules).with_automaton()
+        self.assertEqual(index.shadowed, {0, 1})
+        automaton = compile_automaton([rule[0] for rule in rules], index.shadowed)
+        assert automaton is not None
+        self.assertEqual(automaton.fallbacks, (4,))
+        for word in ["foxes", "a foxes", "cities", "cats", "box"]:
+            self.assertEqual(found(automaton, word), linear_search(rules, word), word)
+            self.assertEqual(found(index, word), linear_search(rules, word), word)
+
+    def test_whole_words(self):
+        self.assertEqual(whole_words(re.compile(r"(?i)^(sheep|deer)$"), 10), {"sheep", "deer"})
+        self.assertEqual(whole_words(re.compile(r"^THOU\Z"), 10), {"thou"})
+        self.assertEqual(whole_words(re.compile(r"(?i)^ab?c{1,2}$"), 10), {"ac", "acc", "abc", "abcc"})
+        self.assertEqual(whole_words(re.compile(r"^[a-c]x$"), 10), {"ax", "bx", "cx"})
+        self.assertEqual(whole_words(re.compile(r"^$"), 10), {""})
+        self.assertIsNone(whole_words(re.compile(r"(?i)^[a-c]x$"), 2))
+        for pattern in [
+            r"(?i)sheep$",
+            r"(?i)^sheep",
+            r"(?m)^sheep$",
+            r"^",
+            r"(?i)^[a-z]+$",
+            r"(?i)^(?:ab|c)*$",
+            r"(?i)^(?-i:x)$",
+            r"(?i)^[^a]$",
+            r"(?i)^.$",
+            r"(?i)^\d$",
+            r"(?i)^pok[eé]mon$",
+            r"(?i)^café$",
+            r"(?i)^\bx$",
+            r"(?i)^(a|\bx)$",
+            r"(?i)^(?:a|\bx){2}$",
+        ]:
+            self.assertIsNone(whole_words(re.compile(pattern), 10), pattern)
+
+    def test_index_falls_back_for_other_words(self):
+        rules = compile_rules([r"(?i)s$", r"(?i)ies$"])
+        index = RuleIndex(rules).with_automaton()
+        self.assertIs(index.with_automaton(), index)
+        for word in ["cities", "citiES", "citieſ", "cities\n", "café"]:
+            self.assertEqual(found(index, word), linear_search(rules, word), repr(word))
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from pluralizer.cache import CacheInfo, LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_get_and_put(self):
+        cache: LRUCache[str, str] = LRUCache(2)
+        self.assertIsNone(cache.get("apple"))
+        cache.put("apple", "apples")
+        self.assertEqual(cache.get("apple"), "apples")
+        self.assertEqual(cache.info(), CacheInfo(hits=1, misses=1, maxsize=2, currsize=1))
+
+    def test_evict_least_recently_used(self):
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(len(cache), 2)
+
+    def test_zero_size_disables_cache(self):
+        cache: LRUCache[str, int] = LRUCache(0)
+        cache.put("a", 1)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.info(), CacheInfo(hits=0, misses=1, maxsize=0, currsize=0))
+
+    def test_negative_size(self):
+        with self.assertRaises(ValueError):
+            _ = LRUCache[str, int](-1)
+
+    def test_clear_keeps_counters(self):
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache.put("a", 1)
+        _ = cache.get("a")
+        cache.clear()
+        self.assertEqual(cache.info(), CacheInfo(hits=1, misses=0, maxsize=2, currsize=0))
+        cache.reset()
+        self.assertEqual(cache.info(), CacheInfo(hits=0, misses=0, maxsize=2, currsize=0))
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,60 @@
+import itertools
+import unittest
+
+from pluralizer.case import CaseShape, case_shape, restore_case
+
+from .test_pluralize import BASIC_TESTS, PLURAL_TESTS, SINGULAR_TESTS
+
+
+def reference_restore_case(word: str, token: str) -> str:
+    """The original case restoration, comparing the word with its lower and upper cased copies."""
+    if word == token:
+        return token
+    if word == word.lower():
+        return token.lower()
+    if word == word.upper():
+        return token.upper()
+    if word[0] == word[0].upper():
+        return token[0].upper() + token[1:].lower()
+    return token.lower()
+
+
+class TestCase(unittest.TestCase):
+    def test_case_shape(self):
+        shapes = {
+            "hello": CaseShape.LOWER,
+            "": CaseShape.LOWER,
+            "123": CaseShape.LOWER,
+            "-'": CaseShape.LOWER,
+            "WHISKY": CaseShape.UPPER,
+            "A1": CaseShape.UPPER,
+            "Title": CaseShape.TITLE,
+            "TItle": CaseShape.TITLE,
+            "1aB": CaseShape.TITLE,
+            "tEST": CaseShape.MIXED,
+            "café": CaseShape.LOWER,
+            "CAFÉ": CaseShape.UPPER,
+            "Café": CaseShape.TITLE,
+            "éCOLE": CaseShape.MIXED,
+        }
+        for word, shape in shapes.items():
+            self.assertIs(case_shape(word), shape, word)
+
+    def test_same_as_reference(self):
+        words: set[str] = {"1aB", "-a-B", "ß", "ǅungla", "İstanbul", "ΣΊΣΥΦΟΣ", "éCOLE", "x1"}
+        for test in [*BASIC_TESTS, *SINGULAR_TESTS, *PLURAL_TESTS]:
+            for word in test:
+                words.update([word, word.upper(), word.title(), word.swapcase(), word.capitalize()])
+        tokens = ["apples", "Apples", "APPLES", "aPPLES", "ies", "", "straße", "İ", "ǆ"]
+
+        for word, token in itertools.product(sorted(words), tokens):
+            try:
+                expected = reference_restore_case(word, token)
+            except IndexError:
+                # The reference fails to title case an empty token.
+                continue
+            self.assertEqual(restore_case(case_shape(word), word, token), expected, (word, token))
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
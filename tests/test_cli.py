@@ -0,0 +1,115 @@
+import io
+import os
+import runpy
+import tempfile
+import unittest
+from typing import Sequence
+from unittest import mock
+
+from pluralizer import Pluralizer
+from pluralizer.cli import main
+
+
+def run(argv: Sequence[str], stdin: str = "") -> tuple[int, str]:
+    stdout = io.StringIO()
+    with mock.patch("sys.stdin", io.StringIO(stdin)), mock.patch("sys.stdout", stdout):
+        status = main(argv)
+    return status, stdout.getvalue()
+
+
+class TestCli(unittest.TestCase):
+    def test_commands(self):
+        words = "cat\nPerson\nsheep\n"
+        self.assertEqual(run(["plural"], words), (0, "cats\nPeople\nsheep\n"))
+        self.assertEqual(run(["singular"], "cats\r\nPeople\n"), (0, "cat\nPerson\n"))
+        self.assertEqual(run(["is-plural"], words), (0, "false\nfalse\ntrue\n"))
+        self.assertEqual(run(["is-singular"], words), (0, "true\ntrue\ntrue\n"))
+
+    def test_batches(self):
+        words = [f"word{index}" for index in range(25)] * 2
+        _, output = run(["plural", "--batch-size", "7", "--cache-size", "0"], "\n".join(words) + "\n")
+        self.assertEqual(output.splitlines(), [f"{word}s" for word in words])
+
+    def test_cache_across_batches(self):
+        created: list[Pluralizer] = []
+
+        def create(cache_size: int) -> Pluralizer:
+            created.append(Pluralizer(cache_size=cache_size))
+            return created[-1]
+
+        words = "box\nbox\ncat\n" * 3
+        with mock.patch("pluralizer.cli.Pluralizer", side_effect=create):
+            self.assertEqual(run(["plural", "--batch-size", "1"], words), (0, "boxes\nboxes\ncats\n" * 3))
+            _ = run(["is-plural", "--batch-size", "3", "--cache-size", "0"], words)
+        self.assertEqual(created[0].cache_info()[:2], (7, 2))
+        # Repeated words of a batch are only looked up once.
+        self.assertEqual(created[1].cache_info()[:2], (0, 6))
+
+    def test_append_and_header(self):
+        self.assertEqual(run(["plural", "--header", "--append"], "word\nbox\n"), (0, "word\tplural\nbox\tboxes\n"))
+        self.assertEqual(run(["plural", "--header"], "word\nbox\n"), (0, "word\nboxes\n"))
+
+    def test_columns(self):
+        rows = "id\tword\n1\tbox\n2\n3\tmice\n"
+        _, output = run(["singular", "--column", "2", "--header"], rows)
+        self.assertEqual(output, "id\tword\n1\tbox\n2\n3\tmouse\n")
+        _, output = run(["singular", "--column", "2", "--header", "--append", "--batch-size", "2"], rows)
+        self.assertEqual(output, "id\tword\tsingular\n1\tbox\tbox\n2\n3\tmice\tmouse\n")
+        _, output = run(["plural", "--column", "1", "--delimiter", ";"], "box;1\n")
+        self.assertEqual(output, "boxes;1\n")
+
+    def test_csv(self):
+        _, output = run(["plural", "--csv"], 'box,"a, b"\n')
+        self.assertEqual(output, 'boxes,"a, b"\n')
+        _, output = run(["is-plural", "--csv", "--column", "2", "--append"], 'a,"big, box"\nb,dogs\n')
+        self.assertEqual(output, 'a,"big, box",false\nb,dogs,true\n')
+        _, output = run(["plural", "--csv", "--delimiter", ";", "--column", "2"], 'box;"c;at"\n')
+        self.assertEqual(output, 'box;"c;ats"\n')
+
+    def test_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "words.txt")
+            with open(path, "w", encoding="latin-1") as file:
+                _ = file.write("façade\n")
+            self.assertEqual(run(["plural", "--encoding", "latin-1", path, "-"], "box\n"), (0, "façades\nboxes\n"))
+
+            with mock.patch("sys.stderr", io.StringIO()) as stderr:
+                with self.assertRaises(SystemExit) as raised:
+                    _ = run(["plural", os.path.join(directory, "missing.txt")])
+            self.assertEqual(raised.exception.code, 1)
+            self.assertIn("No such file", stderr.getvalue())
+
+    def test_invalid_arguments(self):
+        for argv in [
+            ["plural", "--column", "0"],
+            ["plural", "--batch-size", "0"],
+            ["plural", "--cache-size", "-1"],
+            ["plural", "--delimiter", ""],
+            ["plural", "--csv", "--delimiter", "::"],
+            ["pluralize"],
+        ]:
+            with mock.patch("sys.stderr", io.StringIO()):
+                with self.assertRaises(SystemExit) as raised:
+                    _ = run(argv)
+            self.assertEqual(raised.exception.code, 2)
+
+    def test_broken_pipe(self):
+        stdout = mock.Mock()
+        stdout.write.side_effect = BrokenPipeError
+        stdout.fileno.return_value = 99
+        with mock.patch("sys.stdin", io.StringIO("box\n")), mock.patch("sys.stdout", stdout):
+            with mock.patch("os.open", return_value=98), mock.patch("os.dup2") as dup2:
+                self.assertEqual(main(["plural"]), 1)
+        dup2.assert_called_once_with(98, 99)
+
+    def test_module(self):
+        with mock.patch("sys.argv", ["pluralizer", "plural"]), mock.patch("sys.stdin", io.StringIO("box\n")):
+            with mock.patch("sys.stdout", io.StringIO()) as stdout:
+                with self.assertRaises(SystemExit) as raised:
+                    _ = runpy.run_module("pluralizer", run_name="__main__")
+        self.assertEqual(raised.exception.code, 0)
+        self.assertEqual(stdout.getvalue(), "boxes\n")
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
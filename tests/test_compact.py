@@ -0,0 +1,83 @@
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+
+from pluralizer.compact import CompactMap, CompactSet, CompactWords
+
+PAIRS = {f"word{number}": f"words{number}" for number in range(1000)}
+PAIRS.update({"he": "they", "café": "cafés", "": "empty", "ſ": "long s"})
+
+
+class TestCompact(unittest.TestCase):
+    def test_words(self):
+        words = CompactWords(["b", "a", "ccc", "a"])
+        self.assertEqual(len(words), 3)
+        self.assertEqual([words.word(position) for position in range(3)], ["a", "b", "ccc"])
+        self.assertEqual(words.position("ccc"), 2)
+        self.assertGreater(words.nbytes(), 0)
+
+        words.release()
+        self.assertEqual(words.word(2), "ccc")
+        with self.assertRaises(AssertionError):
+            _ = words.position("ccc")
+
+    def test_map(self):
+        words = CompactWords([*PAIRS, *PAIRS.values()])
+        mapping = CompactMap(words, PAIRS)
+        words.release()
+
+        self.assertEqual(len(mapping), len(PAIRS))
+        self.assertEqual(dict(mapping.items()), PAIRS)
+        for key, value in PAIRS.items():
+            self.assertIn(key, mapping)
+            self.assertEqual(mapping[key], value)
+        for missing in ["words1", "word", "s", "CAFÉ", "they"]:
+            self.assertNotIn(missing, mapping)
+            with self.assertRaises(KeyError):
+                _ = mapping[missing]
+        self.assertNotIn(1, mapping)
+        self.assertGreater(mapping.nbytes(), 0)
+
+    def test_set(self):
+        words = CompactWords(PAIRS)
+        members = CompactSet(words, [*PAIRS, "he"])
+        self.assertEqual(len(members), len(PAIRS))
+        self.assertEqual(sorted(members), sorted(PAIRS))
+        self.assertIn("café", members)
+        self.assertNotIn("cafés", members)
+        self.assertNotIn(None, members)
+        self.assertGreater(members.nbytes(), 0)
+
+    def test_empty(self):
+        words = CompactWords([])
+        self.assertEqual(len(words), 0)
+        self.assertNotIn("a", CompactSet(words, []))
+        self.assertNotIn("a", CompactMap(words, {}))
+
+    def test_pickle(self):
+        words = CompactWords([*PAIRS, *PAIRS.values()])
+        mapping = CompactMap(words, PAIRS)
+        words.release()
+        self.assertEqual(dict(pickle.loads(pickle.dumps(mapping)).items()), PAIRS)
+
+        # String hashes differ between processes, the hash tables must be rebuilt.
+        script = (
+            "import pickle, sys\n"
+            "mapping = pickle.loads(sys.stdin.buffer.read())\n"
+            "print(all(mapping[key] == value for key, value in mapping.items()))"
+        )
+        environment = {**os.environ, "PYTHONHASHSEED": "1234"}
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            input=pickle.dumps(mapping),
+            capture_output=True,
+            check=True,
+            env=environment,
+        )
+        self.assertEqual(result.stdout.strip(), b"True")
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,29 @@
+import subprocess
+import sys
+import unittest
+
+# Modules which must only be imported when they are first used.
+LAZY_MODULES = ["pluralizer.pluralizer_rules", "asyncio", "concurrent.futures"]
+
+
+def imported_modules(code: str) -> set[str]:
+    script = f"import sys\n{code}\nprint('\\n'.join(sys.modules))"
+    output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+    return set(output.split())
+
+
+class TestImport(unittest.TestCase):
+    def test_import_is_lazy(self):
+        modules = imported_modules("import pluralizer")
+        self.assertIn("pluralizer.pluralizer", modules)
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, modules)
+
+    def test_rules_are_imported_on_first_use(self):
+        modules = imported_modules("import pluralizer\nassert pluralizer.plural('box') == 'boxes'")
+        self.assertIn("pluralizer.pluralizer_rules", modules)
+        self.assertNotIn("asyncio", modules)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -1,7 +1,16 @@
+import asyncio
+import os
+import pickle
 import re
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
+import pluralizer as pluralizer_module
 from pluralizer import Pluralizer
+from pluralizer.cache import CacheInfo
+from pluralizer.dead_rules import DeadRule, DeadRules
+from pluralizer.stats import RuleStat
 
 # Standard singular/plural matches.
 #
@@ -786,6 +795,574 @@ class TestPluralize(unittest.TestCase):
         pluralizer.add_singular_rule("mornings", "suck")
         self.assertEqual(pluralizer.singular("mornings"), "suck")
 
+    def test_methods_plural_many(self):
+        pluralizer = Pluralizer()
+        tests = [*BASIC_TESTS, *PLURAL_TESTS, *BASIC_TESTS]
+        self.assertEqual(pluralizer.plural_many(test[0] for test in tests), [test[1] for test in tests])
+        self.assertEqual(pluralizer.is_plural_many(test[1] for test in tests), [True] * len(tests))
+
+    def test_methods_singular_many(self):
+        pluralizer = Pluralizer()
+        tests = [*BASIC_TESTS, *SINGULAR_TESTS, *BASIC_TESTS]
+        self.assertEqual(pluralizer.singular_many(test[1] for test in tests), [test[0] for test in tests])
+        self.assertEqual(pluralizer.is_singular_many(test[0] for test in tests), [True] * len(tests))
+
+    def test_pluralize_many(self):
+        pluralizer = Pluralizer()
+        words = ["test", "apples", "test", "person"]
+        self.assertEqual(pluralizer.pluralize_many(words, [5, 1, 1, None]), ["tests", "apple", "test", "people"])
+        self.assertEqual(pluralizer.pluralize_many(words[:2], [5, 1], True), ["5 tests", "1 apple"])
+        with self.assertRaises(ValueError):
+            _ = pluralizer.pluralize_many(words, [1])
+
+    def test_iter_plural(self):
+        pluralizer = Pluralizer()
+        words = iter([test[0] for test in [*BASIC_TESTS, *PLURAL_TESTS, *BASIC_TESTS]])
+        results = pluralizer.iter_plural(words, cache_size=16)
+        self.assertEqual(list(results), [test[1] for test in [*BASIC_TESTS, *PLURAL_TESTS, *BASIC_TESTS]])
+
+    def test_iter_singular(self):
+        pluralizer = Pluralizer()
+        words = iter([test[1] for test in [*BASIC_TESTS, *SINGULAR_TESTS, *BASIC_TESTS]])
+        results = pluralizer.iter_singular(words, cache_size=16)
+        self.assertEqual(list(results), [test[0] for test in [*BASIC_TESTS, *SINGULAR_TESTS, *BASIC_TESTS]])
+
+    def test_iter_plural_is_lazy(self):
+        pluralizer = Pluralizer()
+        results = pluralizer.iter_plural(["paper", "paper", "paper"])
+        self.assertEqual(next(results), "papers")
+        self.assertEqual(next(results), "papers")
+        pluralizer.add_uncountable_rule("paper")
+        self.assertEqual(next(results), "paper")
+
+    def test_plural_parallel(self):
+        pluralizer = Pluralizer()
+        pluralizer.add_irregular_rule("irregular", "regular")
+        tests = [*BASIC_TESTS, *PLURAL_TESTS, ["irregular", "regular"]]
+        words = [test[0] for test in tests]
+        expected = [test[1] for test in tests]
+        self.assertEqual(pluralizer.plural_parallel(words, workers=2, chunksize=10), expected)
+        self.assertEqual(pluralizer.plural_parallel(iter(words), workers=1), expected)
+
+    def test_singular_parallel(self):
+        pluralizer = Pluralizer()
+        pluralizer.add_singular_rule("mornings", "suck")
+        tests = [*BASIC_TESTS, *SINGULAR_TESTS, ["suck", "mornings"]]
+        words = [test[1] for test in tests]
+        expected = [test[0] for test in tests]
+        self.assertEqual(pluralizer.singular_parallel(words, workers=3, chunksize=7), expected)
+        self.assertEqual(pluralizer.singular_parallel(words), expected)
+
+    def test_parallel_chunksize(self):
+        with self.assertRaises(ValueError):
+            _ = Pluralizer().plural_parallel(["apple"], chunksize=0)
+
+    def test_pluralize_text(self):
+        pluralizer = Pluralizer()
+        text = "Found 2 Item, ITEM and items; itemset (Person/person's) left."
+        self.assertEqual(
+            pluralizer.pluralize_text(text, 2, ["item", "people"]),
+            "Found 2 Items, ITEMS and items; itemset (People/people's) left.",
+        )
+        self.assertEqual(
+            pluralizer.pluralize_text(text, 1, ["items", "person"]),
+            "Found 2 Item, ITEM and item; itemset (Person/person's) left.",
+        )
+        self.assertEqual(pluralizer.pluralize_text(text, 2, []), text)
+        self.assertEqual(pluralizer.pluralize_text(text, 2, ["box"]), text)
+        self.assertEqual(
+            pluralizer.pluralize_text("item_id item2 2item _item item-id item", 2, ["item"]),
+            "item_id item2 2item _item items-id items",
+        )
+
+    def test_singularize_text(self):
+        pluralizer = Pluralizer()
+        text = "Boxes:\n- 3 boxes\n- 4 BOXES\n" * 1000
+        self.assertEqual(pluralizer.singularize_text(text, ["box"]), "Box:\n- 3 box\n- 4 BOX\n" * 1000)
+
+    def test_text_scanner_invalidated_by_new_rules(self):
+        pluralizer = Pluralizer()
+        self.assertEqual(pluralizer.pluralize_text("1 regex", 2, ["regex"]), "1 regexes")
+        pluralizer.add_plural_rule(re.compile(r"(?i)gex$"), "gexii")
+        self.assertEqual(pluralizer.pluralize_text("1 regex", 2, ["regex"]), "1 regexii")
+
+    def test_freeze(self):
+        pluralizer = Pluralizer()
+        pluralizer.add_irregular_rule("irregular", "regular")
+        self.assertFalse(pluralizer.frozen)
+        self.assertIs(pluralizer.freeze(), pluralizer)
+        self.assertIs(pluralizer.freeze(), pluralizer)
+        self.assertTrue(pluralizer.frozen)
+
+        for test in [*BASIC_TESTS, *PLURAL_TESTS]:
+            self.assertEqual(pluralizer.plural(test[0]), test[1])
+            self.assertTrue(pluralizer.is_plural(test[1]))
+        for test in [*BASIC_TESTS, *SINGULAR_TESTS]:
+            self.assertEqual(pluralizer.singular(test[1]), test[0])
+            self.assertTrue(pluralizer.is_singular(test[0]))
+        self.assertEqual(pluralizer.plural("irregular"), "regular")
+
+        with self.assertRaises(TypeError):
+            pluralizer.add_plural_rule("person", "peeps")
+        with self.assertRaises(TypeError):
+            pluralizer.add_singular_rule("mornings", "suck")
+        with self.assertRaises(TypeError):
+            pluralizer.add_uncountable_rule("paper")
+        with self.assertRaises(TypeError):
+            pluralizer.add_irregular_rule("single", "plural")
+
+        pluralizer.uncountables["apple"] = True
+        self.assertEqual(pluralizer.plural("apple"), "apples")
+        pluralizer.pluralRules.append((re.compile(r"(?i)gex$"), "gexii"))
+        self.assertEqual(pluralizer.plural("regex"), "regexes")
+
+    def test_rule_lists(self):
+        pluralizer = Pluralizer()
+        self.assertEqual(pluralizer.plural("index"), "indices")
+        pluralizer.singularRules.append((re.compile(r"(?i)gexii$"), "gex"))
+        self.assertEqual(pluralizer.singular("regexii"), "regex")
+        # Finding the appended rule dropped the results cached before.
+        self.assertEqual(pluralizer.cache_info().currsize, 1)
+        pluralizer.pluralRules.append((re.compile(r"(?i)gex$"), "gexii"))
+        self.assertEqual(pluralizer.plural("regex"), "regexii")
+
+        _ = pluralizer.pluralRules.pop()
+        self.assertEqual(pluralizer.plural("Regex"), "Regexes")
+
+    def test_freeze_compact(self):
+        pluralizer = Pluralizer()
+        pluralizer.add_irregular_rule("irregular", "regular")
+        pluralizer.add_irregular_rule("other", "regular")
+        self.assertIs(pluralizer.freeze(compact=True), pluralizer)
+        self.assertIs(pluralizer.freeze(compact=True), pluralizer)
+        self.assertEqual(
+            (pluralizer.uncountables, pluralizer.irregularPlurals, pluralizer.irregularSingles), ({}, {}, {})
+        )
+
+        reference = Pluralizer()
+        reference.add_irregular_rule("irregular", "regular")
+        reference.add_irregular_rule("other", "regular")
+        for test in [*BASIC_TESTS, *PLURAL_TESTS]:
+            self.assertEqual(pluralizer.plural(test[0]), test[1])
+            self.assertTrue(pluralizer.is_plural(test[1]))
+        for test in [*BASIC_TESTS, *SINGULAR_TESTS]:
+            self.assertEqual(pluralizer.singular(test[1]), test[0])
+            self.assertTrue(pluralizer.is_singular(test[0]))
+        for word in ["irregular", "Other", "REGULAR", "sheep", "information"]:
+            self.assertEqual(pluralizer.plural(word), reference.plural(word))
+            self.assertEqual(pluralizer.singular(word), reference.singular(word))
+            self.assertEqual(pluralizer.is_plural(word), reference.is_plural(word))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rules.snapshot")
+            pluralizer.dump(path)
+            loaded = Pluralizer.load(path)
+            self.assertEqual(loaded.irregularSingles, reference.irregularSingles)
+            self.assertEqual(loaded.irregularPlurals, reference.irregularPlurals)
+            self.assertEqual(loaded.uncountables, reference.uncountables)
+
+    def test_frozen_shared_between_threads(self):
+        pluralizer = Pluralizer(cache_size=16).freeze()
+        words = [test[0] for test in [*BASIC_TESTS, *PLURAL_TESTS]] * 20
+        expected = pluralizer.plural_many(words)
+
+        def inflect(_: int) -> list[str]:
+            return [pluralizer.plural(word) for word in words]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(inflect, range(8)))
+        self.assertEqual(results, [expected] * 8)
+
+    def test_instances_do_not_share_added_rules(self):
+        pluralizer = Pluralizer()
+        other = Pluralizer()
+        self.assertEqual(pluralizer.plural("regex"), "regexes")
+        pluralizer.add_plural_rule(re.compile(r"(?i)gex$"), "gexii")
+        pluralizer.add_irregular_rule("irregular", "regular")
+        self.assertEqual(pluralizer.plural("regex"), "regexii")
+        self.assertEqual(other.plural("regex"), "regexes")
+        self.assertEqual(other.plural("irregular"), "irregulars")
+        self.assertEqual(Pluralizer().plural("regex"), "regexes")
+
+    def test_module_functions(self):
+        self.assertIs(pluralizer_module.default_pluralizer(), pluralizer_module.default_pluralizer())
+        self.assertTrue(pluralizer_module.default_pluralizer().frozen)
+        for test in [*BASIC_TESTS, *PLURAL_TESTS]:
+            self.assertEqual(pluralizer_module.plural(test[0]), test[1])
+            self.assertTrue(pluralizer_module.is_plural(test[1]))
+        for test in [*BASIC_TESTS, *SINGULAR_TESTS]:
+            self.assertEqual(pluralizer_module.singular(test[1]), test[0])
+            self.assertTrue(pluralizer_module.is_singular(test[0]))
+        self.assertEqual(pluralizer_module.pluralize("test", 5, True), "5 tests")
+
+    def test_without_default_rules(self):
+        pluralizer = Pluralizer(default_rules=False)
+        self.assertEqual(pluralizer.plural("apple"), "apple")
+        pluralizer.add_plural_rule("apple", "apfel")
+        self.assertEqual(pluralizer.plural("Apple"), "Apfel")
+        self.assertEqual(Pluralizer().plural("apple"), "apples")
+
+    def test_dump_and_load(self):
+        pluralizer = Pluralizer()
+        pluralizer.add_plural_rule(re.compile(r"(?i)gex$"), "gexii")
+        pluralizer.add_uncountable_rule("paper")
+        pluralizer.add_irregular_rule("irregular", "regular")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rules.snapshot")
+            pluralizer.dump(path)
+            self.assertEqual(os.listdir(directory), ["rules.snapshot"])
+            # Readable by the other users the umask allows, like a file created with `open`.
+            reference = os.path.join(directory, "reference")
+            with open(reference, "wb"):
+                pass
+            self.assertEqual(os.stat(path).st_mode, os.stat(reference).st_mode)
+            os.unlink(reference)
+
+            # A failed write leaves neither the destination nor a temporary file behind.
+            os.mkdir(os.path.join(directory, "rules"))
+            with open(os.path.join(directory, "rules", "file"), "wb"):
+                pass
+            with self.assertRaises(OSError):
+                pluralizer.dump(os.path.join(directory, "rules"))
+            self.assertEqual(sorted(os.listdir(directory)), ["rules", "rules.snapshot"])
+
+            for memory_map in (False, True):
+                loaded = Pluralizer.load(path, cache_size=8, memory_map=memory_map)
+                self.assertFalse(loaded.frozen)
+                self.assertEqual(loaded.cache_info().maxsize, 8)
+                self.assertEqual(loaded.pluralRules, pluralizer.pluralRules)
+                self.assertEqual(loaded.singularRules, pluralizer.singularRules)
+                self.assertEqual(loaded.uncountables, pluralizer.uncountables)
+                self.assertEqual(loaded.irregularPlurals, pluralizer.irregularPlurals)
+                self.assertEqual(loaded.irregularSingles, pluralizer.irregularSingles)
+
+                for test in [*BASIC_TESTS, *PLURAL_TESTS]:
+                    self.assertEqual(loaded.plural(test[0]), pluralizer.plural(test[0]))
+                for test in [*BASIC_TESTS, *SINGULAR_TESTS]:
+                    self.assertEqual(loaded.singular(test[1]), pluralizer.singular(test[1]))
+                self.assertEqual(loaded.plural("regex"), "regexii")
+                self.assertEqual(loaded.plural("paper"), "paper")
+                self.assertEqual(loaded.singular("regular"), "irregular")
+
+                loaded.add_plural_rule("apple", "apfel")
+                self.assertEqual(loaded.plural("apple"), "apfel")
+                self.assertEqual(pluralizer.plural("apple"), "apples")
+
+    def test_load_frozen(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rules.snapshot")
+            Pluralizer().freeze().dump(path)
+            loaded = Pluralizer.load(path)
+            self.assertTrue(loaded.frozen)
+            self.assertEqual(loaded.plural("apple"), "apples")
+            with self.assertRaises(TypeError):
+                loaded.add_uncountable_rule("paper")
+
+    def test_load_invalid_snapshot(self):
+        from pluralizer.snapshot import MAGIC, SNAPSHOT_VERSION
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rules.snapshot")
+            contents = [
+                ("not a pluralizer snapshot", b""),
+                ("not a pluralizer snapshot", b"PLURALIZE?\x01\x00"),
+                ("snapshot version 0", MAGIC + b"\x00\x00"),
+                (
+                    "does not contain Pluralizer rules",
+                    MAGIC + SNAPSHOT_VERSION.to_bytes(2, "little") + pickle.dumps([]),
+                ),
+            ]
+            for message, content in contents:
+                with open(path, "wb") as file:
+                    _ = file.write(content)
+                with self.assertRaisesRegex(ValueError, message):
+                    _ = Pluralizer.load(path)
+
+    def test_precompute(self):
+        pluralizer = Pluralizer(cache_size=0)
+        vocabulary = [test[0] for test in [*BASIC_TESTS, *PLURAL_TESTS]]
+        pluralizer.precompute(vocabulary)
+        pluralizer.precompute(["regex"])
+
+        pluralizer.enable_stats()
+        for test in [*BASIC_TESTS, *PLURAL_TESTS]:
+            self.assertEqual(pluralizer.plural(test[0]), test[1])
+            self.assertEqual(pluralizer.singular(test[1]), Pluralizer().singular(test[1]))
+        self.assertEqual(pluralizer.plural("regex"), "regexes")
+        stats = pluralizer.stats()
+        assert stats is not None
+        self.assertEqual(stats.words, 0)
+
+        self.assertEqual(pluralizer.plural("REGEX"), "REGEXES")
+        stats = pluralizer.stats()
+        assert stats is not None
+        self.assertEqual(stats.words, 1)
+
+        pluralizer.add_plural_rule(re.compile(r"(?i)gex$"), "gexii")
+        self.assertEqual(pluralizer.plural("regex"), "regexii")
+
+    def test_save_and_load_precomputed(self):
+        pluralizer = Pluralizer(cache_size=0)
+        pluralizer.add_irregular_rule("irregular", "regular")
+        pluralizer.precompute(["apple", "irregular"])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "words.snapshot")
+            pluralizer.save_precomputed(path)
+
+            loaded = Pluralizer(cache_size=0)
+            with self.assertRaisesRegex(ValueError, "precomputed with different rules"):
+                loaded.load_precomputed(path)
+
+            loaded.add_irregular_rule("irregular", "regular")
+            loaded.load_precomputed(path)
+            loaded.enable_stats()
+            self.assertEqual(loaded.plural("apple"), "apples")
+            self.assertEqual(loaded.singular("regular"), "irregular")
+            stats = loaded.stats()
+            assert stats is not None
+            self.assertEqual(stats.words, 0)
+
+            Pluralizer().dump(path)
+            with self.assertRaisesRegex(ValueError, "does not contain precomputed words"):
+                loaded.load_precomputed(path)
+
+    def test_stats(self):
+        pluralizer = Pluralizer(cache_size=0)
+        self.assertIsNone(pluralizer.stats())
+        pluralizer.add_plural_rule(re.compile(r"(?i)gex$"), "gexii")
+        pluralizer.enable_stats()
+
+        self.assertEqual(pluralizer.plural("regex"), "regexii")
+        self.assertEqual(pluralizer.plural("Echo"), "Echoes")
+        self.assertEqual(pluralizer.plural("echoes"), "echoes")
+        self.assertEqual(pluralizer.plural("advice"), "advice")
+        self.assertEqual(pluralizer.singular("boxes"), "box")
+        self.assertTrue(pluralizer.is_plural("echoes"))
+        self.assertFalse(pluralizer.is_plural("echo"))
+        self.assertTrue(pluralizer.is_singular("advice"))
+        self.assertFalse(pluralizer.is_singular("boxes"))
+        self.assertEqual(pluralizer.singular("xyz"), "xyz")
+        self.assertEqual(pluralizer.plural(""), "")
+
+        stats = pluralizer.stats()
+        assert stats is not None
+        self.assertEqual(stats.words, 11)
+        self.assertEqual(stats.shortcuts, {"keep": 2, "irregular": 2, "uncountable": 2})
+        self.assertEqual(set(stats.seconds), {"lookup", "rules", "replace"})
+        self.assertTrue(all(seconds >= 0 for seconds in stats.seconds.values()))
+
+        self.assertEqual(len(stats.plural_rules), len(pluralizer.pluralRules))
+        self.assertEqual(len(stats.singular_rules), len(pluralizer.singularRules))
+        self.assertEqual(stats.plural_rules[-1], RuleStat("(?i)gex$", "gexii", 1, 1))
+        self.assertEqual(sum(rule.matched for rule in stats.plural_rules), 1)
+        self.assertEqual(sum(rule.matched for rule in stats.singular_rules), 2)
+        self.assertGreaterEqual(sum(rule.tried for rule in stats.singular_rules), 2)
+
+        # Adding rules resets the rule counters. Duplicate rules are equal, but only the newest one is tried.
+        pluralizer.add_plural_rule("thou", "ye")
+        pluralizer.add_plural_rule("thou", "ye")
+        stats = pluralizer.stats()
+        assert stats is not None
+        self.assertEqual(stats.words, 11)
+        self.assertEqual(sum(rule.tried for rule in [*stats.plural_rules, *stats.singular_rules]), 0)
+        self.assertEqual(pluralizer.plural("thou"), "ye")
+        stats = pluralizer.stats()
+        assert stats is not None
+        self.assertEqual(
+            stats.plural_rules[-2:], (RuleStat("(?i)^thou$", "ye", 0, 0), RuleStat("(?i)^thou$", "ye", 1, 1))
+        )
+
+        pluralizer.enable_stats()
+        stats = pluralizer.stats()
+        assert stats is not None
+        self.assertEqual(stats.words, 0)
+
+        pluralizer.disable_stats()
+        self.assertEqual(pluralizer.plural("regex"), "regexii")
+        self.assertIsNone(pluralizer.stats())
+
+    def test_dead_rules(self):
+        pluralizer = Pluralizer(cache_size=0)
+        self.assertEqual(pluralizer.dead_rules(), DeadRules((), ()))
+        plural_rules = len(pluralizer.pluralRules)
+        singular_rules = len(pluralizer.singularRules)
+        thou = [rule[1] for rule in pluralizer.pluralRules].index("you")
+
+        pluralizer.add_plural_rule("thou", "ye")
+        pluralizer.add_plural_rule("thou", "ye")
+        pluralizer.add_singular_rule(re.compile(r"(?i)s$"), "")
+        pluralizer.add_uncountable_rule(re.compile(r"(?i)^(tuna|trout)$"))
+        pluralizer.add_uncountable_rule(re.compile(r"(?i)^(tuna|squid)$"))
+        pluralizer.add_uncountable_rule(re.compile(r"(?i)^pok[eé]mon$"))
+        dead = pluralizer.dead_rules()
+        self.assertEqual(
+            dead.plural_rules,
+            (
+                DeadRule(thou, "(?i)^thou$", "you", "overridden", plural_rules + 1),
+                DeadRule(plural_rules, "(?i)^thou$", "ye", "duplicate", plural_rules + 1),
+                DeadRule(plural_rules + 2, "(?i)^(tuna|trout)$", "$0", "uncountable", None),
+            ),
+        )
+        self.assertEqual(
+            dead.singular_rules,
+            (
+                DeadRule(0, "(?i)s$", "", "duplicate", singular_rules),
+                DeadRule(singular_rules + 1, "(?i)^(tuna|trout)$", "$0", "uncountable", None),
+            ),
+        )
+        self.assertEqual(pluralizer.plural("thou"), "ye")
+        self.assertEqual(pluralizer.singular("squids"), "squid")
+
+        words = [word for test in [*BASIC_TESTS, *PLURAL_TESTS, *SINGULAR_TESTS] for word in test]
+        words += ["thou", "Tuna", "trouts", "squid", "pokémon", "tuna\n", "troutſ"]
+        plurals = pluralizer.plural_many(words)
+        singulars = pluralizer.singular_many(words)
+        self.assertEqual(pluralizer.prune_rules(), DeadRules(dead.plural_rules[:2], dead.singular_rules[:1]))
+        self.assertEqual(len(pluralizer.pluralRules), plural_rules + 3)
+        self.assertEqual(len(pluralizer.singularRules), singular_rules + 3)
+        # The uncountable rules still match words outside of the uncountables, so they are only reported.
+        self.assertEqual(
+            pluralizer.dead_rules(),
+            DeadRules(
+                (DeadRule(plural_rules, "(?i)^(tuna|trout)$", "$0", "uncountable", None),),
+                (DeadRule(singular_rules, "(?i)^(tuna|trout)$", "$0", "uncountable", None),),
+            ),
+        )
+        self.assertEqual(pluralizer.prune_rules(), DeadRules((), ()))
+        self.assertEqual(pluralizer.plural("tuna\n"), "tuna\n")
+        self.assertEqual(pluralizer.plural_many(words), plurals)
+        self.assertEqual(pluralizer.singular_many(words), singulars)
+
+        pluralizer.add_plural_rule("thou", "thee")
+        self.assertEqual(len(pluralizer.freeze(compact=True).dead_rules().plural_rules), 2)
+        with self.assertRaises(TypeError):
+            _ = pluralizer.prune_rules()
+
+    def test_formatter(self):
+        pluralizer = Pluralizer()
+        counts: list[int | None] = [None, 0, 1, 2, -1, 1_000_000]
+        for word in ["item", "Person", "sheep", "BOX"]:
+            for inclusive in [False, True]:
+                formatter = pluralizer.formatter(word, inclusive)
+                expected = [pluralizer.pluralize(word, count, inclusive) for count in counts]
+                self.assertEqual([formatter(count) for count in counts], expected)
+                self.assertEqual(formatter.format_many(counts), expected)
+                self.assertEqual(formatter.format_many(iter(counts)), expected)
+
+        items = pluralizer.formatter("item")
+        self.assertEqual((items.singular, items.plural, items.inclusive), ("item", "items", False))
+        self.assertEqual(items(), "items")
+        pluralizer.add_irregular_rule("item", "itemz")
+        self.assertEqual(items(2), "items")
+
+    def test_analyze(self):
+        pluralizer = Pluralizer(cache_size=0)
+        pluralizer.add_plural_rule(re.compile(r"OX$"), "OXEN")
+        pluralizer.add_singular_rule(re.compile(r"(?i)(?-i:E)ves$"), "eaf")
+        # Only matches the lower cased token of "Zorgz", which decides that the word is not singular.
+        pluralizer.add_singular_rule(re.compile(r"zorgz$"), "zorg")
+        words = {"", "Eaves", "BOX", "Box", "tEST", "café", "ÉCOLES", "straße", "İstanbul", "Zorgz", "ZORGZ"}
+        for test in [*BASIC_TESTS, *SINGULAR_TESTS, *PLURAL_TESTS]:
+            words.update(form for word in test for form in (word, word.upper(), word.title()))
+        for word in words:
+            analysis = pluralizer.analyze(word)
+            self.assertEqual(
+                analysis[:5],
+                (
+                    word,
+                    pluralizer.singular(word),
+                    pluralizer.plural(word),
+                    pluralizer.is_singular(word),
+                    pluralizer.is_plural(word),
+                ),
+                word,
+            )
+
+        analysis = pluralizer.analyze("Boxes")
+        self.assertEqual(analysis.singular_source, "rule")
+        self.assertEqual(analysis.singular_rule, pluralizer.singularRules[10])
+        self.assertEqual((analysis.plural_source, analysis.plural_rule), ("rule", pluralizer.pluralRules[0]))
+        analysis = pluralizer.analyze("echoes")
+        self.assertEqual((analysis.singular_source, analysis.plural_source), ("irregular", "keep"))
+        self.assertEqual((analysis.singular_rule, analysis.plural_rule), (None, None))
+        self.assertEqual(pluralizer.analyze("advice")[5:7], ("uncountable", "uncountable"))
+        self.assertEqual(pluralizer.analyze("")[5:7], ("none", "none"))
+        analysis = pluralizer.analyze("Zorgz")
+        self.assertEqual((analysis.singular, analysis.is_singular, analysis.singular_source), ("Zorgz", False, "none"))
+
+        pluralizer = Pluralizer(default_rules=False)
+        pluralizer.add_plural_rule("box", "boxes")
+        self.assertEqual(pluralizer.analyze("fox")[1:], ("fox", "fox", True, True, "none", "none", None, None))
+
+    def test_cache_results(self):
+        pluralizer = Pluralizer(cache_size=8)
+        for _ in range(3):
+            self.assertEqual(pluralizer.plural("apple"), "apples")
+            self.assertEqual(pluralizer.singular("apples"), "apple")
+            self.assertTrue(pluralizer.is_plural("apples"))
+            self.assertFalse(pluralizer.is_singular("apples"))
+        self.assertEqual(pluralizer.cache_info(), CacheInfo(hits=8, misses=4, maxsize=8, currsize=4))
+
+        pluralizer.cache_clear()
+        self.assertEqual(pluralizer.cache_info(), CacheInfo(hits=0, misses=0, maxsize=8, currsize=0))
+
+    def test_cache_disabled(self):
+        pluralizer = Pluralizer(cache_size=0)
+        self.assertEqual(pluralizer.plural("apple"), "apples")
+        self.assertEqual(pluralizer.plural("apple"), "apples")
+        self.assertEqual(pluralizer.cache_info(), CacheInfo(hits=0, misses=2, maxsize=0, currsize=0))
+
+    def test_cache_invalidated_by_new_rules(self):
+        pluralizer = Pluralizer()
+        self.assertEqual(pluralizer.plural("paper"), "papers")
+        pluralizer.add_uncountable_rule("paper")
+        self.assertEqual(pluralizer.plural("paper"), "paper")
+
+        self.assertEqual(pluralizer.plural("regex"), "regexes")
+        pluralizer.add_plural_rule(re.compile(r"(?i)gex$"), "gexii")
+        self.assertEqual(pluralizer.plural("regex"), "regexii")
+
+        self.assertEqual(pluralizer.singular("singles"), "single")
+        pluralizer.add_singular_rule(re.compile("singles$"), "singular")
+        self.assertEqual(pluralizer.singular("singles"), "singular")
+
+        self.assertTrue(pluralizer.is_plural("irregulars"))
+        pluralizer.add_irregular_rule("irregulars", "regular")
+        self.assertFalse(pluralizer.is_plural("irregulars"))
+
+
+class TestPluralizeAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_aplural_many(self):
+        pluralizer = Pluralizer()
+        tests = [*BASIC_TESTS, *PLURAL_TESTS]
+        expected = [test[1] for test in tests]
+        self.assertEqual(await pluralizer.aplural_many(test[0] for test in tests), expected)
+        self.assertEqual(await pluralizer.aplural_many((test[0] for test in tests), chunksize=10), expected)
+        self.assertEqual(await pluralizer.ais_plural_many(expected, chunksize=10), [True] * len(tests))
+
+    async def test_asingular_many(self):
+        pluralizer = Pluralizer()
+        tests = [*BASIC_TESTS, *SINGULAR_TESTS]
+        expected = [test[0] for test in tests]
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = await pluralizer.asingular_many([test[1] for test in tests], chunksize=10, executor=executor)
+        self.assertEqual(results, expected)
+        self.assertEqual(await pluralizer.ais_singular_many(expected, chunksize=10), [True] * len(tests))
+
+    async def test_async_chunksize(self):
+        with self.assertRaises(ValueError):
+            _ = await Pluralizer().aplural_many(["apple"], chunksize=0)
+
+    async def test_async_cancellation(self):
+        pluralizer = Pluralizer()
+        task = asyncio.ensure_future(pluralizer.aplural_many(["apple"] * 100_000, chunksize=1))
+        await asyncio.sleep(0)
+        _ = task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
 
 if __name__ == "__main__":
     _ = unittest.main()
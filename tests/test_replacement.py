@@ -0,0 +1,68 @@
+import re
+import unittest
+
+from pluralizer import Pluralizer
+from pluralizer.case import case_shape, restore_case
+from pluralizer.replacement import Replacement, compile_replacement
+
+from .test_rule_index import corpus
+
+
+def replaced(word: str, match: re.Match[str], replacement: Replacement) -> str:
+    """Replace a match like `Pluralizer._replace` does."""
+    start, end = match.span()
+    matched = word[start - 1] if start == end else match.group(0)
+    return word[:start] + restore_case(case_shape(matched), matched, replacement.expand(match)) + word[end:]
+
+
+class TestReplacement(unittest.TestCase):
+    def test_segments(self):
+        self.assertEqual(Replacement("$1$2ves").segments, (1, 2, "ves"))
+        self.assertEqual(Replacement("a$1b").segments, ("a", 1, "b"))
+        self.assertEqual(Replacement("$12x").segments, (12, "x"))
+        self.assertEqual(Replacement("").segments, ())
+
+    def test_expand(self):
+        match = re.search(r"(?:(kni|wi|li)fe|(ar|l|ea|eo|oa|hoo)f)$", "wolf")
+        assert match is not None
+        self.assertEqual(Replacement("$1$2ves").expand(match), "lves")
+        self.assertEqual(Replacement("$0").expand(match), "lf")
+        self.assertEqual(Replacement("men").expand(match), "men")
+
+    def test_literal(self):
+        self.assertEqual(Replacement("ses").literal, "ses")
+        self.assertIsNone(Replacement("$1ies").literal)
+
+    def test_missing_group(self):
+        match = re.search(r"(a)$", "a")
+        assert match is not None
+        with self.assertRaises(IndexError):
+            _ = Replacement("$2").expand(match)
+
+    def test_keeps(self):
+        pluralizer = Pluralizer()
+        words = sorted({word.lower() for word in corpus()})
+        rules = [*pluralizer.pluralRules, *pluralizer.singularRules]
+        others = ["$0", "$1ES", "$1Σ", "é$1", "$1$2", "$2", "S", ""]
+        rules += [(re.compile(r"(?i)(ss|é|σ)?(s)?$"), replacement) for replacement in others]
+        for pattern, source in rules:
+            replacement = Replacement(source)
+            for word in words:
+                match = pattern.search(word)
+                if match is not None:
+                    self.assertEqual(
+                        replacement.keeps(word, match),
+                        replaced(word, match, replacement) == word,
+                        (pattern.pattern, source, word),
+                    )
+
+        self.assertIsNone(Replacement("$1Σ").lowered)
+        self.assertEqual(Replacement("$1ES").lowered, (1, "es"))
+
+    def test_compile_replacement_is_shared(self):
+        self.assertIs(compile_replacement("$1es"), compile_replacement("$1es"))
+        self.assertEqual(compile_replacement("$1es").source, "$1es")
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,112 @@
+import itertools
+import re
+import unittest
+from typing import Sequence
+
+from pluralizer import Pluralizer
+from pluralizer.rule_index import Rule, RuleIndex, rule_suffixes, shadowed_rules
+
+from .test_pluralize import BASIC_TESTS, PLURAL_TESTS, SINGULAR_TESTS
+
+
+def linear_match(rules: Sequence[Rule], word: str) -> int | None:
+    for position in range(len(rules) - 1, -1, -1):
+        if rules[position][0].search(word):
+            return position
+    return None
+
+
+def indexed_match(index: RuleIndex, word: str) -> int | None:
+    for position in index.candidates(word):
+        if index.rules[position][0].search(word):
+            return position
+    return None
+
+
+def corpus() -> set[str]:
+    words: set[str] = set()
+    for test in [*BASIC_TESTS, *SINGULAR_TESTS, *PLURAL_TESTS]:
+        for word in test:
+            words.update([word, word.upper(), word.title()])
+    # Short endings, including characters that match ASCII letters case insensitively.
+    for length in range(1, 4):
+        for chars in itertools.product("aefhilmnosuvxyzſK\n é", repeat=length):
+            words.add("".join(chars))
+            words.add("t" + "".join(chars))
+    return words
+
+
+class TestRuleIndex(unittest.TestCase):
+    def test_rule_suffixes(self):
+        self.assertEqual(rule_suffixes(re.compile(r"(?i)(x|ch|ss)$")), {"x", "hc", "ss"})
+        self.assertEqual(rule_suffixes(re.compile(r"(?i)s?$")), {"", "s"})
+        self.assertEqual(rule_suffixes(re.compile(r"(?i)[^aeiou]ese$")), {"ese"})
+        self.assertEqual(rule_suffixes(re.compile(r"(?i)\b(mon|smil)ies$")), {"sei"})
+        self.assertEqual(rule_suffixes(re.compile(r"(?i)[ml]ice$")), {"eci"})
+        self.assertEqual(rule_suffixes(re.compile(r"(?i)[a-c]z$")), {"za", "zb", "zc"})
+        self.assertEqual(rule_suffixes(re.compile(r"(?i)(?:ab)+$")), {"ba"})
+        self.assertEqual(rule_suffixes(re.compile(r"(?i)(?:ab)*c$")), {"c", "cba"})
+        self.assertEqual(rule_suffixes(re.compile(r"(?i)[a-z]s$")), {"s"})
+        self.assertEqual(rule_suffixes(re.compile(r"(?i)é$")), {""})
+        self.assertEqual(rule_suffixes(re.compile(r"(?i)[xé]s$")), {"s"})
+        self.assertEqual(rule_suffixes(re.compile(r"(?i)\bs$")), {"s"})
+        self.assertEqual(rule_suffixes(re.compile(r"(?i)(?<!a)s$")), {"s"})
+        self.assertEqual(rule_suffixes(re.compile(r"(?i)s\Z")), {"s"})
+
+    def test_rule_suffixes_not_indexable(self):
+        self.assertIsNone(rule_suffixes(re.compile(r"gex")))
+        self.assertIsNone(rule_suffixes(re.compile(r"")))
+        self.assertIsNone(rule_suffixes(re.compile(r"(?m)gex$")))
+
+    def test_same_first_match_as_linear_scan(self):
+        pluralizer = Pluralizer()
+        pluralizer.add_plural_rule(re.compile(r"(?i)gex"), "gexii")
+        pluralizer.add_singular_rule(re.compile(r"(?m)ies$"), "y")
+        for index in [RuleIndex(pluralizer.pluralRules), RuleIndex(pluralizer.singularRules)]:
+            for word in corpus():
+                self.assertEqual(indexed_match(index, word), linear_match(index.rules, word), repr(word))
+
+    def test_search(self):
+        rules: list[Rule] = [(re.compile(r"(?i)s$"), ""), (re.compile(r"(?i)(x|ch)es$"), "$1")]
+        index = RuleIndex(rules)
+        found = index.search("boxes")
+        assert found is not None
+        self.assertEqual(found[0], 1)
+        self.assertEqual(found[1].span(), (2, 5))
+        self.assertIsNone(index.search("box"))
+
+    def test_keeps(self):
+        rules: list[Rule] = [(re.compile(r"(?i)s$"), ""), (re.compile(r"(?i)(x|ch)es$"), "$1es")]
+        index = RuleIndex(rules)
+        self.assertTrue(index.keeps("boxes"))
+        self.assertFalse(index.keeps("cats"))
+        self.assertTrue(index.keeps("cat"))
+
+    def test_shadowed_rules(self):
+        rules: list[Rule] = [
+            (re.compile(r"(?i)s$"), ""),
+            (re.compile(r"(?i)ies$"), "y"),
+            (re.compile(r"s$"), ""),
+            (re.compile(r"(?i)s$"), "x"),
+            (re.compile(r"(?i)ies$"), "y"),
+            (re.compile(r"(?i)gex"), "gexii"),
+            (re.compile(r"(?i)gex"), "gexes"),
+        ]
+        self.assertEqual(shadowed_rules(rules), {0: 3, 1: 4, 5: 6})
+        index = RuleIndex(rules)
+        self.assertEqual(index.shadowed, {0, 1, 5})
+        self.assertEqual(index.candidates("cities"), (6, 4, 3, 2))
+        for word in ["cities", "cats", "CATS", "regex", "box", "ſ"]:
+            self.assertEqual(indexed_match(index, word), linear_match(rules, word), word)
+
+    def test_snapshot(self):
+        rules: list[Rule] = [(re.compile(r"(?i)s$"), ""), (re.compile(r"(?i)ice$"), "ouse")]
+        index = RuleIndex(rules)
+        index.build()
+        rules.clear()
+        self.assertEqual(index.candidates("mice"), (1,))
+        self.assertEqual(index.replacements[1].source, "ouse")
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,114 @@
+import importlib
+import importlib.util
+import sys
+import unittest
+from typing import Any
+from unittest import mock
+
+from pluralizer import Pluralizer
+
+from .test_pluralize import BASIC_TESTS, PLURAL_TESTS
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+
+SINGULARS = [test[0] for test in [*BASIC_TESTS, *PLURAL_TESTS]]
+PLURALS = [test[1] for test in [*BASIC_TESTS, *PLURAL_TESTS]]
+
+
+class TestVectorized(unittest.TestCase):
+    def test_requires_numpy(self):
+        with mock.patch.dict(sys.modules, {"numpy": None}):
+            with self.assertRaisesRegex(ImportError, "requires NumPy"):
+                _ = Pluralizer().plural_array(["apple"])
+            with self.assertRaisesRegex(ImportError, "requires NumPy"):
+                _ = Pluralizer().singular_array(["apples"])
+            with self.assertRaisesRegex(ImportError, "requires NumPy"):
+                _ = Pluralizer().formatter("apple").format_array([1, 2])
+
+    @unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+    def test_numpy_arrays(self):
+        numpy: Any = importlib.import_module("numpy")
+
+        pluralizer = Pluralizer()
+        words = numpy.array(SINGULARS * 3)
+        result = pluralizer.plural_array(words)
+        self.assertIsInstance(result, numpy.ndarray)
+        self.assertEqual(result.dtype.kind, "U")
+        self.assertEqual(result.tolist(), PLURALS * 3)
+        self.assertEqual(pluralizer.singular_array(result).tolist(), pluralizer.singular_many(PLURALS * 3))
+
+        matrix = numpy.array([["apple", "Person"], ["BOX", "apple"]])
+        self.assertEqual(pluralizer.plural_array(matrix).tolist(), [["apples", "People"], ["BOXES", "apples"]])
+
+        objects = numpy.array(["apple", "box", "apple"], dtype=object)
+        result = pluralizer.plural_array(objects)
+        self.assertEqual(result.dtype, object)
+        self.assertEqual(result.tolist(), ["apples", "boxes", "apples"])
+        missing = numpy.array([["apple", None], [float("nan"), "apple"]], dtype=object)
+        result = pluralizer.plural_array(missing)
+        self.assertEqual(result[0].tolist(), ["apples", None])
+        self.assertTrue(numpy.isnan(result[1, 0]))
+        self.assertEqual(result[1, 1], "apples")
+        self.assertEqual(pluralizer.plural_array(numpy.array([None], dtype=object)).tolist(), [None])
+
+        empty = numpy.array([], dtype=str)
+        self.assertEqual(pluralizer.plural_array(empty).shape, (0,))
+
+        with self.assertRaisesRegex(TypeError, "array of strings"):
+            _ = pluralizer.plural_array(numpy.array([1, 2]))
+
+    @unittest.skipUnless(HAS_NUMPY and HAS_PANDAS, "pandas is not installed")
+    def test_pandas_series(self):
+        pandas: Any = importlib.import_module("pandas")
+
+        pluralizer = Pluralizer()
+        series = pandas.Series(["apple", None, "box", "apple"], index=[3, 2, 1, 0], name="noun")
+        result = pluralizer.plural_array(series)
+        self.assertIsInstance(result, pandas.Series)
+        self.assertEqual(result.name, "noun")
+        self.assertEqual(result.index.tolist(), [3, 2, 1, 0])
+        # Missing values stay missing, as None or NaN depending on the version of pandas.
+        self.assertTrue(pandas.isna(result.iloc[1]))
+        self.assertEqual(result.drop(index=2).tolist(), ["apples", "boxes", "apples"])
+
+        strings = pandas.Series(["apples", pandas.NA, "boxes"], dtype="string")
+        result = pluralizer.singular_array(strings)
+        self.assertEqual(result.dtype, strings.dtype)
+        self.assertEqual(result[0], "apple")
+        self.assertIs(result[1], pandas.NA)
+        self.assertEqual(result[2], "box")
+
+        categories = pandas.Series(["apple", "box", "apple"], dtype="category")
+        self.assertEqual(pluralizer.plural_array(categories).tolist(), ["apples", "boxes", "apples"])
+
+        missing = pandas.Series([None, None], dtype=object)
+        self.assertEqual(pluralizer.plural_array(missing).tolist(), [None, None])
+
+    @unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+    def test_format_numpy_counts(self):
+        numpy: Any = importlib.import_module("numpy")
+
+        pluralizer = Pluralizer()
+        items = pluralizer.formatter("item", inclusive=True)
+        counts = [0, 1, 2, -1]
+        result = items.format_array(numpy.array(counts))
+        self.assertEqual(result.dtype, object)
+        self.assertEqual(result.tolist(), [pluralizer.pluralize("item", count, True) for count in counts])
+        self.assertEqual(items.format_array(numpy.array([1.0, 2.5])).tolist(), ["1.0 item", "2.5 items"])
+        self.assertEqual(items.format_array(numpy.array([[1], [3]])).tolist(), [["1 item"], ["3 items"]])
+        self.assertEqual(pluralizer.formatter("box").format_array(numpy.array([1, 2])).tolist(), ["box", "boxes"])
+
+    @unittest.skipUnless(HAS_NUMPY and HAS_PANDAS, "pandas is not installed")
+    def test_format_pandas_counts(self):
+        pandas: Any = importlib.import_module("pandas")
+
+        counts = pandas.Series([1, 5], index=["a", "b"], name="orders")
+        result = Pluralizer().formatter("order", inclusive=True).format_array(counts)
+        self.assertIsInstance(result, pandas.Series)
+        self.assertEqual(result.name, "orders")
+        self.assertEqual(result.to_dict(), {"a": "1 order", "b": "5 orders"})
+
+
+if __name__ == "__main__":
+    _ = unittest.main()